@@ -7,9 +7,7 @@ connection.
 
 from __future__ import annotations
 
-import re
-from graphlib import CycleError, TopologicalSorter
-from itertools import chain
+from functools import lru_cache
 
 import duckdb
 
@@ -25,82 +23,172 @@ def validate_identifier(name: str) -> str:
     Must start with a letter or underscore and contain only alphanumeric
     characters and underscores.
 
+    For ASCII input, ``str.isidentifier`` accepts exactly
+    ``[A-Za-z_][A-Za-z0-9_]*``, so the check runs at C speed without a regex.
+
     Raises:
         ValueError: If the name contains invalid characters.
     """
-    if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", name):
+    if not (name.isascii() and name.isidentifier()):
         raise ValueError(f"Invalid identifier: {name!r}")
     return name
 
 
+@lru_cache(maxsize=4096)
 def quote_identifier(name: str) -> str:
-    """Wrap a validated identifier in double quotes for safe use in SQL."""
+    """Wrap a validated identifier in double quotes for safe use in SQL.
+
+    Results are memoized since the same column names recur across column,
+    PK, UNIQUE and FK clauses.
+    """
     return f'"{validate_identifier(name)}"'
 
 
-def build_load_order(table_defs: list[TableDef]) -> list[TableDef]:
-    """Return table definitions sorted by foreign-key dependency order.
+def precompile_identifiers(table_defs: list[TableDef]) -> None:
+    """Validate and quote every identifier used by the table definitions.
+
+    Covers table names, column names and foreign-key reference targets, so an
+    invalid name fails before any SQL is emitted and later quote_identifier
+    calls are plain cache hits.
+
+    Raises:
+        ValueError: If any name is not a valid identifier.
+    """
+    for tdef in table_defs:
+        quote_identifier(tdef.table.name)
+        for col in tdef.columns:
+            quote_identifier(col.name)
+        for fk in tdef.table_constraints.foreign_keys:
+            quote_identifier(fk.references.table)
+            for c in fk.references.columns:
+                quote_identifier(c)
+
 
-    Builds a DAG from foreign-key references and returns the topologically
-    sorted list so that referenced tables are created before dependents.
+def build_load_levels(table_defs: list[TableDef]) -> list[list[TableDef]]:
+    """Group table definitions into foreign-key dependency levels.
+
+    Each level only references tables in earlier levels, so the tables of
+    one level are independent of each other and can be loaded concurrently.
 
     Raises:
         ValueError: If a foreign key references an undefined table or if a
             circular dependency is detected.
     """
     name_to_def: dict[str, TableDef] = {}
+    has_fk = False
     for tdef in table_defs:
         name_to_def[tdef.table.name] = tdef
+        has_fk |= bool(tdef.table_constraints.foreign_keys)
+
+    # Without foreign keys every table is independent; keep the input order.
+    if not has_fk:
+        return [list(name_to_def.values())] if name_to_def else []
 
-    graph: dict[str, set[str]] = {tdef.table.name: set() for tdef in table_defs}
+    # Kahn's algorithm: indegree counts each table's distinct referenced
+    # tables, dependents maps a table to the tables that reference it.
+    indegree: dict[str, int] = {}
+    dependents: dict[str, list[str]] = {name: [] for name in name_to_def}
     for tdef in table_defs:
+        name = tdef.table.name
+        refs: set[str] = set()
         for fk in tdef.table_constraints.foreign_keys:
             ref_table = fk.references.table
             if ref_table not in name_to_def:
                 raise ValueError(
-                    f"FK reference table is not defined: "
-                    f"{tdef.table.name} -> {ref_table}"
+                    f"FK reference table is not defined: {name} -> {ref_table}"
                 )
-            graph[tdef.table.name].add(ref_table)
+            if ref_table not in refs:
+                refs.add(ref_table)
+                dependents[ref_table].append(name)
+        indegree[name] = len(refs)
+
+    levels: list[list[TableDef]] = []
+    placed = 0
+    level = [name for name, degree in indegree.items() if degree == 0]
+    while level:
+        levels.append([name_to_def[name] for name in level])
+        placed += len(level)
+        next_level: list[str] = []
+        for name in level:
+            for dependent in dependents[name]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    next_level.append(dependent)
+        level = next_level
+
+    if placed != len(indegree):
+        residual = [name for name, degree in indegree.items() if degree > 0]
+        raise ValueError(f"Circular dependency detected: {residual}")
+    return levels
+
+
+def build_load_order(table_defs: list[TableDef]) -> list[TableDef]:
+    """Return table definitions sorted by foreign-key dependency order.
 
-    sorter: TopologicalSorter[str] = TopologicalSorter(graph)
-    try:
-        ordered_names = list(sorter.static_order())
-    except CycleError as e:
-        raise ValueError(f"Circular dependency detected: {e.args[1]}") from e
+    Flattens ``build_load_levels`` so that referenced tables are created
+    before dependents.
 
-    return [name_to_def[name] for name in ordered_names]
+    Raises:
+        ValueError: If a foreign key references an undefined table or if a
+            circular dependency is detected.
+    """
+    return [tdef for level in build_load_levels(table_defs) for tdef in level]
 
 
 def build_create_table_sql(tdef: TableDef) -> str:
-    """Generate a CREATE TABLE SQL statement from a table definition."""
-    table_name = quote_identifier(tdef.table.name)
-    col_defs = (
-        f"    {quote_identifier(col.name)} {col.type}"
-        + (" NOT NULL" if col.not_null else "")
-        for col in tdef.columns
-    )
-    pk_defs = (
-        f"    PRIMARY KEY ({', '.join(quote_identifier(c) for c in pk.columns)})"
-        for pk in tdef.table_constraints.primary_key
-    )
-    uq_defs = (
-        f"    UNIQUE ({', '.join(quote_identifier(c) for c in uq.columns)})"
-        for uq in tdef.table_constraints.unique
-    )
-    fk_defs = (
-        f"    FOREIGN KEY ({', '.join(quote_identifier(c) for c in fk.columns)})"
-        f" REFERENCES {quote_identifier(fk.references.table)}"
-        f" ({', '.join(quote_identifier(c) for c in fk.references.columns)})"
-        for fk in tdef.table_constraints.foreign_keys
-    )
-    body = ",\n".join(chain(col_defs, pk_defs, uq_defs, fk_defs))
-    return f"CREATE TABLE {table_name} (\n{body}\n)"
+    """Generate a CREATE TABLE SQL statement from a table definition.
+
+    Fragments are appended to a single buffer and joined once at the end.
+    Column names are quoted once up front and reused by the PK/UNIQUE/FK
+    clauses, whose columns are guaranteed by TableDef validation to exist.
+    """
+    constraints = tdef.table_constraints
+    quoted = {col.name: quote_identifier(col.name) for col in tdef.columns}
+    parts: list[str] = ["CREATE TABLE ", quote_identifier(tdef.table.name), " (\n"]
+    for col in tdef.columns:
+        parts.extend(("    ", quoted[col.name], " ", col.type))
+        if col.not_null:
+            parts.append(" NOT NULL")
+        parts.append(",\n")
+    for pk in constraints.primary_key:
+        parts.extend(
+            (
+                "    PRIMARY KEY (",
+                ", ".join([quoted[c] for c in pk.columns]),
+                "),\n",
+            )
+        )
+    for uq in constraints.unique:
+        parts.extend(
+            (
+                "    UNIQUE (",
+                ", ".join([quoted[c] for c in uq.columns]),
+                "),\n",
+            )
+        )
+    for fk in constraints.foreign_keys:
+        parts.extend(
+            (
+                "    FOREIGN KEY (",
+                ", ".join([quoted[c] for c in fk.columns]),
+                ") REFERENCES ",
+                quote_identifier(fk.references.table),
+                " (",
+                ", ".join([quote_identifier(c) for c in fk.references.columns]),
+                "),\n",
+            )
+        )
+    # Replace the trailing ",\n" separator of the last clause (at least one
+    # column is guaranteed by TableDef validation).
+    last = parts.pop()
+    parts.append(last[:-2] + "\n)")
+    return "".join(parts)
 
 
 def create_tables(conn: duckdb.DuckDBPyConnection, table_defs: list[TableDef]) -> None:
     """Create all tables in dependency order on the given DuckDB connection."""
     ordered = build_load_order(table_defs)
+    precompile_identifiers(ordered)
     for tdef in ordered:
         sql = build_create_table_sql(tdef)
         conn.execute(sql)
@@ -7,7 +7,8 @@ table, returning structured results with OK / NG / SKIPPED status.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from itertools import chain
+from functools import lru_cache
+from typing import Any
 
 import duckdb
 
@@ -31,11 +32,20 @@ class CheckResult:
     message: str
 
 
-def make_skipped_result(check: CheckDef, table_name: str, message: str) -> CheckResult:
-    """Create a SKIPPED CheckResult for a check that cannot run."""
+def make_skipped_result(
+    check: CheckDef,
+    table_name: str,
+    message: str,
+    qtable: str | None = None,
+) -> CheckResult:
+    """Create a SKIPPED CheckResult for a check that cannot run.
+
+    ``qtable`` is the already-quoted table name substituted for ``{table}``;
+    it is derived from ``table_name`` when omitted.
+    """
     query = check.query
     if "{table}" in query:
-        query = query.replace("{table}", quote_identifier(table_name))
+        query = _materialize(query, qtable or quote_identifier(table_name))
     logger.warning(
         "Check skipped",
         extra={
@@ -52,90 +62,157 @@ def make_skipped_result(check: CheckDef, table_name: str, message: str) -> Check
     )
 
 
+@lru_cache(maxsize=4096)
+def _materialize(template: str, qtable: str) -> str:
+    """Substitute the quoted table name into a query template (memoized)."""
+    return template.replace("{table}", qtable)
+
+
+def _count_query(condition: str) -> str:
+    """Return a query template counting the rows that match a condition."""
+    return f"SELECT COUNT(*) FROM {{table}} WHERE {condition}"
+
+
+@lru_cache(maxsize=1024)
+def _allowed_values_condition(col_name: str) -> str:
+    """Return the WHERE condition matching disallowed values (memoized)."""
+    qcol = quote_identifier(col_name)
+    return f"{qcol} NOT IN (SELECT UNNEST(?::VARCHAR[])) AND {qcol} IS NOT NULL"
+
+
+def _allowed_values_description(col: ColumnDef) -> str:
+    """Return the description of a column's allowed-values check."""
+    return f"{col.logical_name}({col.name}) allowed values check"
+
+
 def _build_allowed_values_check(table_name: str, col: ColumnDef) -> CheckDef:
     """Build a CheckDef that verifies column values are within the allowed set."""
-    qcol = quote_identifier(col.name)
     return CheckDef(
-        description=f"{col.logical_name}({col.name}) allowed values check",
-        query=(
-            f"SELECT COUNT(*) FROM {{table}} "
-            f"WHERE {qcol} NOT IN (SELECT UNNEST(?::VARCHAR[])) "
-            f"AND {qcol} IS NOT NULL"
-        ),
+        description=_allowed_values_description(col),
+        query=_count_query(_allowed_values_condition(col.name)),
         expect_zero=True,
         params=[col.allowed_values],
     )
 
 
+# (has_min, has_max) -> (WHERE condition template, description template)
+_RANGE_TEMPLATES: dict[tuple[bool, bool], tuple[str, str]] = {
+    (True, False): ("({q} < ?) AND {q} IS NOT NULL", "min={min}"),
+    (False, True): ("({q} > ?) AND {q} IS NOT NULL", "max={max}"),
+    (True, True): ("({q} < ? OR {q} > ?) AND {q} IS NOT NULL", "min={min}, max={max}"),
+}
+
+
+@lru_cache(maxsize=1024)
+def _range_condition(col_name: str, has_min: bool, has_max: bool) -> str:
+    """Return the WHERE condition matching out-of-range values (memoized)."""
+    template, _ = _RANGE_TEMPLATES[has_min, has_max]
+    return template.format(q=quote_identifier(col_name))
+
+
+def _range_description(col: ColumnDef) -> str:
+    """Return the description of a column's min/max range check."""
+    _, template = _RANGE_TEMPLATES[col.min is not None, col.max is not None]
+    bounds = template.format(min=col.min, max=col.max)
+    return f"{col.logical_name}({col.name}) range check ({bounds})"
+
+
 def _build_range_check(table_name: str, col: ColumnDef) -> CheckDef:
     """Build a CheckDef that verifies column values are within the min/max range."""
-    qcol = quote_identifier(col.name)
-    conditions: list[str] = []
-    params: list[float] = []
-    if col.min is not None:
-        conditions.append(f"{qcol} < ?")
-        params.append(col.min)
-    if col.max is not None:
-        conditions.append(f"{qcol} > ?")
-        params.append(col.max)
-    where_clause = " OR ".join(conditions)
-    range_parts: list[str] = []
-    if col.min is not None:
-        range_parts.append(f"min={col.min}")
-    if col.max is not None:
-        range_parts.append(f"max={col.max}")
+    has_min = col.min is not None
+    has_max = col.max is not None
     return CheckDef(
-        description=(
-            f"{col.logical_name}({col.name}) range check ({', '.join(range_parts)})"
-        ),
-        query=(
-            f"SELECT COUNT(*) FROM {{table}} "
-            f"WHERE ({where_clause}) AND {qcol} IS NOT NULL"
-        ),
+        description=_range_description(col),
+        query=_count_query(_range_condition(col.name, has_min, has_max)),
         expect_zero=True,
-        params=params,
+        params=[b for b in (col.min, col.max) if b is not None],
     )
 
 
+def _row_condition(condition: RowConditionDef) -> str:
+    """Return the WHERE condition matching rows that violate a row condition."""
+    return f"NOT ({condition.condition})"
+
+
 def _build_row_condition_check(condition: RowConditionDef) -> CheckDef:
     """Build a CheckDef from a declarative row-level condition."""
     return CheckDef(
         description=condition.description,
-        query=f"SELECT COUNT(*) FROM {{table}} WHERE NOT ({condition.condition})",
+        query=_count_query(_row_condition(condition)),
         expect_zero=True,
     )
 
 
+def _build_generated_checks(
+    table_name: str, tdef: TableDef
+) -> list[tuple[CheckDef, str]]:
+    """Build the checks derived from column and row-condition definitions.
+
+    Returns (check, condition) pairs in execution order, where condition is
+    the WHERE clause matching violating rows.
+    """
+    generated: list[tuple[CheckDef, str]] = []
+    for col in tdef.columns:
+        if col.allowed_values:
+            generated.append(
+                (
+                    _build_allowed_values_check(table_name, col),
+                    _allowed_values_condition(col.name),
+                )
+            )
+    for col in tdef.columns:
+        if col.min is not None or col.max is not None:
+            generated.append(
+                (
+                    _build_range_check(table_name, col),
+                    _range_condition(
+                        col.name, col.min is not None, col.max is not None
+                    ),
+                )
+            )
+    for rc in tdef.table_constraints.row_conditions:
+        generated.append((_build_row_condition_check(rc), _row_condition(rc)))
+    return generated
+
+
+def _make_result(
+    check: CheckDef, query: str, count: int, table_name: str
+) -> CheckResult:
+    """Evaluate a check's result count against its expectation."""
+    if check.expect_zero:
+        status = CheckStatus.OK if count == 0 else CheckStatus.NG
+    else:
+        status = CheckStatus.OK if count > 0 else CheckStatus.NG
+    message = "" if status is CheckStatus.OK else f"Result count: {count}"
+    if status is CheckStatus.NG:
+        logger.error(
+            "Check failed",
+            extra={
+                "table": table_name,
+                "check_description": check.description,
+            },
+        )
+    return CheckResult(
+        description=check.description,
+        query=query,
+        status=status,
+        result_count=count,
+        message=message,
+    )
+
+
 def _execute_check(
     conn: duckdb.DuckDBPyConnection,
     check: CheckDef,
     table_name: str,
+    qtable: str,
 ) -> CheckResult:
     """Execute a single check query and return a CheckResult."""
-    query = check.query.replace("{table}", quote_identifier(table_name))
+    query = _materialize(check.query, qtable)
     try:
         result = conn.execute(query, check.params or None).fetchone()
         count = int(result[0]) if result else 0
-        if check.expect_zero:
-            status = CheckStatus.OK if count == 0 else CheckStatus.NG
-        else:
-            status = CheckStatus.OK if count > 0 else CheckStatus.NG
-        message = "" if status == CheckStatus.OK else f"Result count: {count}"
-        if status == CheckStatus.NG:
-            logger.error(
-                "Check failed",
-                extra={
-                    "table": table_name,
-                    "check_description": check.description,
-                },
-            )
-        return CheckResult(
-            description=check.description,
-            query=query,
-            status=status,
-            result_count=count,
-            message=message,
-        )
+        return _make_result(check, query, count, table_name)
     except Exception as e:
         logger.error(
             "Check execution error",
@@ -154,6 +231,69 @@ def _execute_check(
         )
 
 
+def _execute_fused_checks(
+    conn: duckdb.DuckDBPyConnection,
+    generated: list[tuple[CheckDef, str]],
+    table_name: str,
+    qtable: str,
+) -> list[CheckResult]:
+    """Execute generated checks as a single table scan.
+
+    Each check becomes a ``COUNT(*) FILTER (WHERE ...)`` column of one query.
+    If the fused query fails (e.g. a malformed row condition), every check is
+    re-run individually so the error is attributed to the offending check.
+    """
+    if not generated:
+        return []
+    fused_sql = (
+        "SELECT "
+        + ", ".join(f"COUNT(*) FILTER (WHERE {cond})" for _, cond in generated)
+        + f" FROM {qtable}"
+    )
+    params: list[Any] = []
+    for check, _ in generated:
+        params.extend(check.params)
+    try:
+        row = conn.execute(fused_sql, params or None).fetchone()
+    except Exception:
+        logger.debug("Fused check query failed", extra={"table": table_name})
+        return [
+            _execute_check(conn, check, table_name, qtable) for check, _ in generated
+        ]
+    return [
+        _make_result(
+            check,
+            _materialize(check.query, qtable),
+            int(row[i]) if row else 0,
+            table_name,
+        )
+        for i, (check, _) in enumerate(generated)
+    ]
+
+
+def _skip_all_checks(
+    tdef: TableDef, qtable: str, message: str
+) -> tuple[list[CheckResult], list[CheckResult]]:
+    """Mark every check of a table as SKIPPED.
+
+    Generated checks come from ``_build_generated_checks`` so the skipped list
+    always matches what ``run_checks`` would have executed.
+    """
+    table_name = tdef.table.name
+    checks_results = [
+        make_skipped_result(check, table_name, message, qtable)
+        for check, _ in _build_generated_checks(table_name, tdef)
+    ]
+    for check in tdef.table_constraints.checks:
+        checks_results.append(make_skipped_result(check, table_name, message, qtable))
+    agg_results = [
+        make_skipped_result(check, table_name, message, qtable)
+        for check in tdef.table_constraints.aggregation_checks
+    ]
+    logger.info("Checks completed", extra={"table": table_name})
+    return checks_results, agg_results
+
+
 def run_checks(
     conn: duckdb.DuckDBPyConnection,
     tdef: TableDef,
@@ -165,65 +305,24 @@ def run_checks(
     Returns a tuple of (check_results, aggregation_check_results).
     """
     table_name = tdef.table.name
+    qtable = quote_identifier(table_name)
     logger.info("Starting checks", extra={"table": table_name})
 
     # Skip all checks if load errors exist
     if load_errors:
-        skip_msg = "Skipped due to load error"
-        all_checks = chain(
-            (
-                _build_allowed_values_check(table_name, col)
-                for col in tdef.columns
-                if col.allowed_values
-            ),
-            (
-                _build_range_check(table_name, col)
-                for col in tdef.columns
-                if col.min is not None or col.max is not None
-            ),
-            (
-                _build_row_condition_check(rc)
-                for rc in tdef.table_constraints.row_conditions
-            ),
-            tdef.table_constraints.checks,
-        )
-        checks_results: list[CheckResult] = [
-            make_skipped_result(check, table_name, skip_msg) for check in all_checks
-        ]
-        agg_results: list[CheckResult] = [
-            make_skipped_result(check, table_name, skip_msg)
-            for check in tdef.table_constraints.aggregation_checks
-        ]
-        logger.info("Checks completed", extra={"table": table_name})
-        return checks_results, agg_results
-
+        return _skip_all_checks(tdef, qtable, "Skipped due to load error")
     # Normal case: execute checks
-    checks_results = (
-        [
-            _execute_check(
-                conn, _build_allowed_values_check(table_name, col), table_name
-            )
-            for col in tdef.columns
-            if col.allowed_values
-        ]
-        + [
-            _execute_check(conn, _build_range_check(table_name, col), table_name)
-            for col in tdef.columns
-            if col.min is not None or col.max is not None
-        ]
-        + [
-            _execute_check(conn, _build_row_condition_check(rc), table_name)
-            for rc in tdef.table_constraints.row_conditions
-        ]
-        + [
-            _execute_check(conn, check, table_name)
-            for check in tdef.table_constraints.checks
-        ]
+    checks_results = _execute_fused_checks(
+        conn, _build_generated_checks(table_name, tdef), table_name, qtable
+    )
+    checks_results.extend(
+        _execute_check(conn, check, table_name, qtable)
+        for check in tdef.table_constraints.checks
     )
 
     # 3. aggregation_checks
     agg_results = [
-        _execute_check(conn, check, table_name)
+        _execute_check(conn, check, table_name, qtable)
         for check in tdef.table_constraints.aggregation_checks
     ]
 
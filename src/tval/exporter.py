@@ -6,6 +6,8 @@ statement.
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -34,45 +36,127 @@ class ExportResult:
     message: str = ""
 
 
-def export_table(
-    conn: duckdb.DuckDBPyConnection,
-    tdef: TableDef,
-    output_base_dir: str | Path,
-) -> ExportResult:
-    """Export a table to Parquet format, optionally partitioned by columns."""
+def _resolve_base_dir(output_base_dir: str | Path) -> Path:
+    """Create the export base directory and return its resolved path."""
+    base = Path(output_base_dir).resolve()
+    base.mkdir(parents=True, exist_ok=True)
+    return base
+
+
+def _prepare_export(tdef: TableDef, base: Path) -> tuple[Path, str, str]:
+    """Create a table's output directory and build its COPY statement.
+
+    ``base`` must be an existing, already-resolved directory (see
+    ``_resolve_base_dir``), so no per-table path resolution is needed.
+
+    Returns (output_dir, output_path, sql).
+    """
     table_name = tdef.table.name
-    output_dir = Path(output_base_dir) / table_name
-    output_dir.mkdir(parents=True, exist_ok=True)
+    output_dir = base / table_name
+    output_dir.mkdir(exist_ok=True)
 
-    qtable = quote_identifier(table_name)
     partition_by = tdef.export.partition_by
-
-    try:
-        if partition_by:
-            partition_cols = ", ".join(quote_identifier(c) for c in partition_by)
-            output_path = str(output_dir.resolve())
-            sql = (
-                f"COPY {qtable} TO '{_escape_string_literal(output_path)}' "
-                f"(FORMAT parquet, PARTITION_BY ({partition_cols}), "
-                f"OVERWRITE_OR_IGNORE)"
+    if partition_by:
+        output_path = str(output_dir)
+    else:
+        output_path = str(output_dir / f"{table_name}.parquet")
+
+    parts: list[str] = [
+        "COPY ",
+        quote_identifier(table_name),
+        " TO '",
+        _escape_string_literal(output_path),
+        "' (FORMAT parquet",
+    ]
+    if partition_by:
+        parts.extend(
+            (
+                ", PARTITION_BY (",
+                ", ".join([quote_identifier(c) for c in partition_by]),
+                "), OVERWRITE_OR_IGNORE",
             )
-            conn.execute(sql)
-        else:
-            output_file = output_dir / f"{table_name}.parquet"
-            output_path = str(output_file.resolve())
-            escaped_path = _escape_string_literal(output_path)
-            sql = f"COPY {qtable} TO '{escaped_path}' (FORMAT parquet)"
-            conn.execute(sql)
+        )
+    parts.append(")")
+    return output_dir, output_path, "".join(parts)
+
+
+def _error_result(table_name: str, output_dir: Path, error: Exception) -> ExportResult:
+    """Build the ERROR result of a failed table export."""
+    return ExportResult(
+        table_name=table_name,
+        status=ExportStatus.ERROR,
+        output_path=str(output_dir),
+        message=str(error),
+    )
 
+
+def _export_to_base(
+    conn: duckdb.DuckDBPyConnection,
+    tdef: TableDef,
+    base: Path,
+) -> ExportResult:
+    """Export a table under an already-resolved base directory."""
+    table_name = tdef.table.name
+    try:
+        _, output_path, sql = _prepare_export(tdef, base)
+        conn.execute(sql)
         return ExportResult(
             table_name=table_name,
             status=ExportStatus.OK,
             output_path=output_path,
         )
     except Exception as e:
-        return ExportResult(
-            table_name=table_name,
-            status=ExportStatus.ERROR,
-            output_path=str(output_dir),
-            message=str(e),
-        )
+        return _error_result(table_name, base / table_name, e)
+
+
+def export_table(
+    conn: duckdb.DuckDBPyConnection,
+    tdef: TableDef,
+    output_base_dir: str | Path,
+) -> ExportResult:
+    """Export a table to Parquet format, optionally partitioned by columns."""
+    try:
+        base = _resolve_base_dir(output_base_dir)
+    except Exception as e:
+        table_name = tdef.table.name
+        return _error_result(table_name, Path(output_base_dir) / table_name, e)
+    return _export_to_base(conn, tdef, base)
+
+
+def _export_on_cursor(
+    cursor: duckdb.DuckDBPyConnection,
+    tdef: TableDef,
+    base: Path,
+) -> ExportResult:
+    """Export one table on a dedicated cursor, closing it afterwards."""
+    with cursor:
+        return _export_to_base(cursor, tdef, base)
+
+
+def export_tables(
+    conn: duckdb.DuckDBPyConnection,
+    table_defs: list[TableDef],
+    output_base_dir: str | Path,
+) -> list[ExportResult]:
+    """Export several tables concurrently, one COPY per table on its own cursor.
+
+    The base directory is resolved and created once for all tables. Each
+    table succeeds or fails on its own, so errors are attributed to the
+    table that caused them. Results keep the order of table_defs.
+    """
+    try:
+        base = _resolve_base_dir(output_base_dir)
+    except Exception as e:
+        return [
+            _error_result(tdef.table.name, Path(output_base_dir) / tdef.table.name, e)
+            for tdef in table_defs
+        ]
+    if len(table_defs) <= 1:
+        return [_export_to_base(conn, tdef, base) for tdef in table_defs]
+    max_workers = min(len(table_defs), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_export_on_cursor, conn.cursor(), tdef, base)
+            for tdef in table_defs
+        ]
+        return [future.result() for future in futures]
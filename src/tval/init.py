@@ -6,6 +6,7 @@ config.yaml, and appends tval-specific entries to .gitignore.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 CONFIG_TEMPLATE = """\
@@ -40,15 +41,13 @@ def run_init(target_dir: str = "./tval") -> None:
     try:
         target.mkdir(parents=True)
         created_paths.append(target)
-        for subdir in ["schema", "data", "output"]:
+        for subdir in ("schema", "data", "output"):
             sub = target / subdir
             sub.mkdir()
             created_paths.append(sub)
-
-        # Place .gitkeep files
-        for subdir in ["schema", "data", "output"]:
-            gitkeep = target / subdir / ".gitkeep"
-            gitkeep.touch()
+            # Place .gitkeep with a single open(O_CREAT) instead of Path.touch
+            gitkeep = sub / ".gitkeep"
+            os.close(os.open(gitkeep, os.O_CREAT | os.O_WRONLY, 0o644))
             created_paths.append(gitkeep)
 
         # Generate config.yaml
@@ -70,16 +69,21 @@ def run_init(target_dir: str = "./tval") -> None:
     print(f"Created {target}/")  # noqa: T201
 
     # Append to .gitignore (not rolled back — appending to existing file is harmless)
-    gitignore_path = Path(".gitignore")
-    existing_lines: set[str] = set()
-    if gitignore_path.exists():
-        existing_lines = set(gitignore_path.read_text(encoding="utf-8").splitlines())
-
-    entries_to_add = [e for e in GITIGNORE_ENTRIES if e not in existing_lines]
-
-    if entries_to_add:
-        with open(gitignore_path, "a", encoding="utf-8") as f:
+    # A single "a+" open both reads the existing entries and appends new ones.
+    # Lines are streamed and reading stops once every entry has been seen.
+    with open(".gitignore", "a+", encoding="utf-8") as f:
+        f.seek(0)
+        found: set[str] = set()
+        for line in f:
+            entry = line.rstrip("\r\n")
+            if entry in GITIGNORE_ENTRIES:
+                found.add(entry)
+                if len(found) == len(GITIGNORE_ENTRIES):
+                    break
+        entries_to_add = [e for e in GITIGNORE_ENTRIES if e not in found]
+        if entries_to_add:
             f.write("\n" + "\n".join(entries_to_add) + "\n")
+    if entries_to_add:
         print("Appended tval/data/, tval/output/ to .gitignore")  # noqa: T201
 
     print(  # noqa: T201
@@ -6,10 +6,14 @@ and structured error reporting for load failures.
 
 from __future__ import annotations
 
+import codecs
+import os
 import re
 import shutil
 import tempfile
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 
 import chardet
@@ -24,6 +28,19 @@ logger = get_logger(__name__)
 
 SUPPORTED_EXTENSIONS = {".csv", ".xlsx", ".parquet"}
 
+# Bytes read from the head of a CSV for encoding detection. Detection only
+# ever sees this bounded sample, never the whole file.
+_CHARDET_SAMPLE_SIZE = 8192
+# Buffer size (in characters) used when streaming a CSV into its UTF-8 copy.
+_TRANSCODE_BUFFER_SIZE = 1 << 20
+# Detected encodings (normalized: lowercase, no "-"/"_") that DuckDB's CSV
+# reader decodes natively, mapped to the name read_csv expects.
+_DUCKDB_CSV_ENCODINGS: dict[str, str] = {
+    "iso88591": "latin-1",
+    "latin1": "latin-1",
+    "utf16": "utf-16",
+}
+
 
 class EncodingDetectionError(Exception):
     """Raised when chardet's confidence is below the configured threshold."""
@@ -40,23 +57,30 @@ class LoadError:
     raw_message: str
 
 
-def _resolve_csv_path(
+def _detect_csv_encoding(
     file_path: str,
     confidence_threshold: float,
-) -> tuple[str, bool]:
-    """Detect CSV encoding and convert to UTF-8 if needed.
+) -> tuple[str | None, str | None]:
+    """Detect CSV encoding and decide how DuckDB should read the file.
 
-    Returns a tuple of (resolved_path, is_temporary). If the file is already
-    UTF-8/ASCII, returns the original path. Otherwise, creates a temporary
-    UTF-8 copy.
+    Returns a tuple of (duckdb_encoding, transcode_from). UTF-8/ASCII files
+    (including UTF-8 with a BOM) need neither. Encodings DuckDB's CSV reader
+    decodes natively (latin-1, UTF-16) are returned as the encoding to pass to
+    read_csv. Anything else is returned as transcode_from: the file must be
+    copied to UTF-8 with ``_transcode_to_utf8`` before DuckDB reads it.
 
     Raises:
         EncodingDetectionError: If detection confidence is below the threshold.
     """
-    _CHARDET_SAMPLE_SIZE = 8192
     with open(file_path, "rb") as f:
         sample = f.read(_CHARDET_SAMPLE_SIZE)
 
+    # Common cases decided without chardet: DuckDB reads UTF-8 (with or
+    # without BOM) natively, and an ASCII sample is what chardet would call
+    # "ascii" anyway.
+    if sample.startswith(codecs.BOM_UTF8) or sample.isascii():
+        return None, None
+
     detected = chardet.detect(sample)
     encoding: str = detected.get("encoding") or "utf-8"
     confidence: float = detected.get("confidence") or 0.0
@@ -68,8 +92,13 @@ def _resolve_csv_path(
             f"threshold={confidence_threshold})"
         )
 
-    if encoding.lower().replace("-", "") in ("utf8", "ascii"):
-        return file_path, False
+    normalized = encoding.lower().replace("-", "").replace("_", "")
+    if normalized in ("utf8", "ascii"):
+        return None, None
+
+    duckdb_encoding = _DUCKDB_CSV_ENCODINGS.get(normalized)
+    if duckdb_encoding is not None:
+        return duckdb_encoding, None
 
     logger.info(
         "Converting CSV to temporary UTF-8 file",
@@ -79,15 +108,33 @@ def _resolve_csv_path(
             "confidence": detected.get("confidence"),
         },
     )
+    return None, encoding
+
+
+def _transcode_to_utf8(file_path: str, encoding: str) -> str:
+    """Stream a CSV file into a temporary UTF-8 copy and return its path.
+
+    The caller removes the copy once it has been read; a partially written
+    copy is removed here if the conversion fails.
+    """
     tmp = tempfile.NamedTemporaryFile(
         mode="w",
         encoding="utf-8",
         suffix=".csv",
         delete=False,
     )
-    with open(file_path, "r", encoding=encoding, errors="replace") as src, tmp:
-        shutil.copyfileobj(src, tmp)
-    return tmp.name, True
+    try:
+        with open(file_path, "r", encoding=encoding, errors="replace") as src, tmp:
+            shutil.copyfileobj(src, tmp, _TRANSCODE_BUFFER_SIZE)
+    except Exception:
+        Path(tmp.name).unlink(missing_ok=True)
+        raise
+    return tmp.name
+
+
+def _encoding_option(encoding: str | None) -> str:
+    """Return the read_csv encoding option for a natively decoded encoding."""
+    return f", encoding='{encoding}'" if encoding else ""
 
 
 def _col_expr(col: ColumnDef) -> str:
@@ -102,32 +149,77 @@ def _col_expr(col: ColumnDef) -> str:
     return qname
 
 
-def _build_insert_select(tdef: TableDef) -> str:
-    """Build a SELECT clause with STRPTIME conversions for format-specified columns."""
-    format_cols = {col.name: col for col in tdef.columns if col.format}
-    if not format_cols:
-        return "SELECT *"
-
-    return "SELECT " + ", ".join(_col_expr(c) for c in tdef.columns)
-
+def _build_insert_clauses(tdef: TableDef) -> tuple[str, str]:
+    """Build the SELECT clause and the columns/types override in one pass.
 
-def _build_columns_override(tdef: TableDef) -> str:
-    """Build a columns/types override string for read_csv or read_xlsx.
+    The SELECT clause is ``SELECT *`` unless some column has a format
+    specifier, in which case it lists every column and wraps formatted ones
+    in STRPTIME. The override always gives explicit column types from the
+    table definition, with formatted columns read as VARCHAR so that
+    STRPTIME can parse them. It is used as read_csv's ``columns`` and
+    read_xlsx's ``types``.
 
-    Always returns explicit column types from the table definition.
-    Columns with a format specifier are overridden to VARCHAR so that
-    STRPTIME can parse them in the SELECT clause.
+    Returns (select_clause, columns_override).
     """
-    format_cols = {col.name for col in tdef.columns if col.format}
-
-    return (
-        "{"
-        + ", ".join(
-            f"'{col.name}': '{'VARCHAR' if col.name in format_cols else col.type}'"
-            for col in tdef.columns
-        )
-        + "}"
-    )
+    exprs: list[str] = []
+    overrides: list[str] = []
+    has_format = False
+    for col in tdef.columns:
+        exprs.append(_col_expr(col))
+        if col.format:
+            has_format = True
+            overrides.append(f"'{col.name}': 'VARCHAR'")
+        else:
+            overrides.append(f"'{col.name}': '{col.type}'")
+    select_clause = "SELECT " + ", ".join(exprs) if has_format else "SELECT *"
+    return select_clause, "{" + ", ".join(overrides) + "}"
+
+
+# (literal, pattern, error_type, column group, row group). The literal is a
+# substring every match must contain; checking it first with ``in`` skips the
+# regex engine for patterns that cannot apply to the message.
+_ERROR_PATTERNS: tuple[
+    tuple[str, re.Pattern[str], str, int | None, int | None], ...
+] = (
+    (
+        "Could not convert",
+        re.compile(
+            r"Could not convert .+ to (\w+) in column \"(\w+)\".+Row: (\d+)",
+            re.DOTALL,
+        ),
+        "TYPE_MISMATCH",
+        2,
+        3,
+    ),
+    (
+        "NOT NULL constraint failed",
+        re.compile(r"NOT NULL constraint failed: \w+\.(\w+)"),
+        "NOT_NULL",
+        1,
+        None,
+    ),
+    (
+        " columns but ",
+        re.compile(r"has (\d+) columns but (\d+) values"),
+        "COLUMN_MISMATCH",
+        None,
+        None,
+    ),
+    (
+        "Violates foreign key constraint",
+        re.compile(r"Violates foreign key constraint because key .+ does not exist"),
+        "FK_VIOLATION",
+        None,
+        None,
+    ),
+    (
+        "Duplicate key",
+        re.compile(r"Duplicate key .+ violates (primary key|unique) constraint"),
+        "UNIQUE_VIOLATION",
+        None,
+        None,
+    ),
+)
 
 
 def parse_duckdb_error(file_path: str, message: str) -> LoadError:
@@ -137,70 +229,18 @@ def parse_duckdb_error(file_path: str, message: str) -> LoadError:
     and UNIQUE_VIOLATION patterns. Unrecognized errors are classified as
     UNKNOWN.
     """
-    # TYPE_MISMATCH
-    m = re.search(
-        r"Could not convert .+ to (\w+) in column \"(\w+)\".+Row: (\d+)",
-        message,
-        re.DOTALL,
-    )
-    if m:
-        return LoadError(
-            file_path=file_path,
-            error_type="TYPE_MISMATCH",
-            column=m.group(2),
-            row=int(m.group(3)),
-            raw_message=message,
-        )
-
-    # NOT_NULL
-    m = re.search(r"NOT NULL constraint failed: \w+\.(\w+)", message)
-    if m:
-        return LoadError(
-            file_path=file_path,
-            error_type="NOT_NULL",
-            column=m.group(1),
-            row=None,
-            raw_message=message,
-        )
-
-    # COLUMN_MISMATCH
-    m = re.search(r"has (\d+) columns but (\d+) values", message)
-    if m:
-        return LoadError(
-            file_path=file_path,
-            error_type="COLUMN_MISMATCH",
-            column=None,
-            row=None,
-            raw_message=message,
-        )
-
-    # FK_VIOLATION
-    m = re.search(
-        r"Violates foreign key constraint because key .+ does not exist",
-        message,
-    )
-    if m:
-        return LoadError(
-            file_path=file_path,
-            error_type="FK_VIOLATION",
-            column=None,
-            row=None,
-            raw_message=message,
-        )
-
-    # UNIQUE_VIOLATION
-    m = re.search(
-        r"Duplicate key .+ violates (primary key|unique) constraint",
-        message,
-    )
-    if m:
-        return LoadError(
-            file_path=file_path,
-            error_type="UNIQUE_VIOLATION",
-            column=None,
-            row=None,
-            raw_message=message,
-        )
+    for literal, pattern, error_type, column_group, row_group in _ERROR_PATTERNS:
+        if literal not in message:
+            continue
+        m = pattern.search(message)
+        if m:
+            return LoadError(
+                file_path=file_path,
+                error_type=error_type,
+                column=m.group(column_group) if column_group else None,
+                row=int(m.group(row_group)) if row_group else None,
+                raw_message=message,
+            )
 
     return LoadError(
         file_path=file_path,
@@ -216,12 +256,14 @@ def _check_extra_columns(
     tdef: TableDef,
     file_path: str,
     ext: str,
+    encoding: str | None = None,
 ) -> LoadError | None:
     """Check if the data file has columns not defined in the schema."""
     try:
         if ext == ".csv":
             result = conn.execute(
-                "SELECT * FROM read_csv(?, header=true, auto_detect=true) LIMIT 0",
+                "SELECT * FROM read_csv(?, header=true, auto_detect=true"
+                f"{_encoding_option(encoding)}) LIMIT 0",
                 [file_path],
             )
         elif ext == ".xlsx":
@@ -257,16 +299,17 @@ def _check_extra_columns(
 def _insert_csv(
     conn: duckdb.DuckDBPyConnection,
     tdef: TableDef,
-    file_path: str,
+    file_path: str | list[str],
     select_clause: str,
     columns_override: str,
+    encoding: str | None = None,
 ) -> None:
-    """Insert a CSV file into the corresponding DuckDB table."""
+    """Insert one CSV file, or a list of them, into the DuckDB table."""
     table_name = quote_identifier(tdef.table.name)
     sql = (
         f"INSERT INTO {table_name} {select_clause} "
         f"FROM read_csv(?, header=true, "
-        f"columns={columns_override})"
+        f"columns={columns_override}{_encoding_option(encoding)})"
     )
     conn.execute(sql, [file_path])
 
@@ -280,24 +323,24 @@ def _insert_xlsx(
 ) -> None:
     """Insert an XLSX file into the corresponding DuckDB table."""
     table_name = quote_identifier(tdef.table.name)
-    if columns_override:
-        sql = (
-            f"INSERT INTO {table_name} {select_clause} "
-            f"FROM read_xlsx(?, header=true, "
-            f"types={columns_override})"
-        )
-    else:
-        sql = f"INSERT INTO {table_name} {select_clause} FROM read_xlsx(?, header=true)"
+    sql = (
+        f"INSERT INTO {table_name} {select_clause} "
+        f"FROM read_xlsx(?, header=true, types={columns_override})"
+    )
     conn.execute(sql, [file_path])
 
 
 def _insert_parquet(
     conn: duckdb.DuckDBPyConnection,
     tdef: TableDef,
-    file_path: str,
+    file_path: str | list[str],
     select_clause: str,
 ) -> None:
-    """Insert a Parquet file into the corresponding DuckDB table."""
+    """Insert one Parquet file, or a list of them, into the DuckDB table.
+
+    For a list, DuckDB matches each file's columns by name against the first
+    file; a file missing one of them fails the whole INSERT.
+    """
     table_name = quote_identifier(tdef.table.name)
     # NOTE: read_parquet does not support a columns override parameter.
     # format + Parquet combination is not yet supported; STRPTIME in
@@ -306,38 +349,14 @@ def _insert_parquet(
     conn.execute(sql, [file_path])
 
 
-def _insert_file(
-    conn: duckdb.DuckDBPyConnection,
+def _load_error_from_exception(
     tdef: TableDef,
     file_path: str,
-    ext: str,
+    error: Exception,
     confidence_threshold: float,
-) -> LoadError | None:
-    """Insert a single data file into the corresponding DuckDB table."""
-    select_clause = _build_insert_select(tdef)
-    columns_override = _build_columns_override(tdef)
-
-    resolved_path = file_path
-    is_tmp = False
-
-    try:
-        if ext == ".csv":
-            resolved_path, is_tmp = _resolve_csv_path(file_path, confidence_threshold)
-
-        # Check for extra columns before INSERT
-        extra_error = _check_extra_columns(conn, tdef, resolved_path, ext)
-        if extra_error:
-            extra_error.file_path = file_path  # Report original path
-            return extra_error
-
-        if ext == ".csv":
-            _insert_csv(conn, tdef, resolved_path, select_clause, columns_override)
-        elif ext == ".parquet":
-            _insert_parquet(conn, tdef, resolved_path, select_clause)
-        elif ext == ".xlsx":
-            _insert_xlsx(conn, tdef, resolved_path, select_clause, columns_override)
-        return None
-    except EncodingDetectionError as e:
+) -> LoadError:
+    """Log a file load failure and convert it into a LoadError."""
+    if isinstance(error, EncodingDetectionError):
         logger.error(
             "Encoding detection confidence is below threshold",
             extra={
@@ -352,22 +371,179 @@ def _insert_file(
             error_type="ENCODING_DETECTION_FAILED",
             column=None,
             row=None,
-            raw_message=str(e),
+            raw_message=str(error),
         )
+    return _load_error_from_duckdb(tdef, file_path, error)
+
+
+def _load_error_from_duckdb(
+    tdef: TableDef, file_path: str, error: Exception
+) -> LoadError:
+    """Log a DuckDB load failure and convert it into a LoadError."""
+    load_error = parse_duckdb_error(file_path, str(error))
+    logger.error(
+        "File load error",
+        extra={
+            "table": tdef.table.name,
+            "file": file_path,
+            "error_type": load_error.error_type,
+        },
+    )
+    return load_error
+
+
+def _insert_xlsx_file(
+    conn: duckdb.DuckDBPyConnection,
+    tdef: TableDef,
+    file_path: str,
+    select_clause: str,
+    columns_override: str,
+) -> LoadError | None:
+    """Check an XLSX file's columns and insert it into the DuckDB table.
+
+    CSV and Parquet files are inserted in batches; XLSX files are still
+    inserted one at a time. ``select_clause`` and
+    ``columns_override`` are the table's precomputed ``_build_insert_clauses``
+    results.
+    """
+    try:
+        extra_error = _check_extra_columns(conn, tdef, file_path, ".xlsx")
+        if extra_error:
+            return extra_error
+        _insert_xlsx(conn, tdef, file_path, select_clause, columns_override)
+        return None
     except Exception as e:
-        error = parse_duckdb_error(file_path, str(e))
-        logger.error(
-            "File load error",
-            extra={
-                "table": tdef.table.name,
-                "file": file_path,
-                "error_type": error.error_type,
-            },
+        return _load_error_from_duckdb(tdef, file_path, e)
+
+
+@dataclass
+class _PendingFile:
+    """A data file queued for a batched insert."""
+
+    file_path: str
+    # Source encoding when the file needs a UTF-8 copy before DuckDB reads it
+    transcode_from: str | None = None
+
+
+@dataclass
+class _PreparedFile:
+    """A data file that passed column checks, ready to insert."""
+
+    file_path: str
+    resolved_path: str
+
+
+def _insert_batch(
+    tdef: TableDef,
+    batch: list[_PreparedFile],
+    insert: Callable[[str | list[str]], None],
+    confidence_threshold: float,
+) -> list[LoadError]:
+    """Insert files of one format (and encoding) with a single reader call.
+
+    ``insert`` takes a path or a list of paths. DuckDB reads the whole list in
+    one statement. A failed INSERT leaves the table untouched, so on failure
+    each file is inserted on its own to attribute errors to the files that
+    caused them.
+    """
+    if len(batch) > 1:
+        try:
+            insert([f.resolved_path for f in batch])
+            return []
+        except Exception:
+            logger.debug(
+                "Batched insert failed, inserting per file",
+                extra={"table": tdef.table.name},
+            )
+    errors: list[LoadError] = []
+    for f in batch:
+        try:
+            insert(f.resolved_path)
+        except Exception as e:
+            errors.append(
+                _load_error_from_exception(tdef, f.file_path, e, confidence_threshold)
+            )
+    return errors
+
+
+def _flush_batch(
+    conn: duckdb.DuckDBPyConnection,
+    tdef: TableDef,
+    ext: str,
+    encoding: str | None,
+    pending: list[_PendingFile],
+    select_clause: str,
+    columns_override: str,
+    confidence_threshold: float,
+) -> list[LoadError]:
+    """Check and insert a run of consecutive files of the same kind.
+
+    CSV files that need a UTF-8 copy are transcoded here, right before the
+    insert, and the copies are removed once the batch is done, so only one
+    batch's copies exist on disk at a time.
+    """
+    if ext == ".csv":
+        insert: Callable[[str | list[str]], None] = partial(
+            _insert_csv,
+            conn,
+            tdef,
+            select_clause=select_clause,
+            columns_override=columns_override,
+            encoding=encoding,
         )
-        return error
+    else:
+        insert = partial(_insert_parquet, conn, tdef, select_clause=select_clause)
+
+    errors: list[LoadError] = []
+    ready: list[_PreparedFile] = []
+    tmp_paths: list[str] = []
+    try:
+        for f in pending:
+            resolved_path = f.file_path
+            if f.transcode_from is not None:
+                try:
+                    resolved_path = _transcode_to_utf8(f.file_path, f.transcode_from)
+                except Exception as e:
+                    errors.append(
+                        _load_error_from_exception(
+                            tdef, f.file_path, e, confidence_threshold
+                        )
+                    )
+                    continue
+                tmp_paths.append(resolved_path)
+            extra_error = _check_extra_columns(conn, tdef, resolved_path, ext, encoding)
+            if extra_error:
+                extra_error.file_path = f.file_path  # Report original path
+                errors.append(extra_error)
+                continue
+            ready.append(_PreparedFile(f.file_path, resolved_path))
+        if ready:
+            batch_errors = _insert_batch(tdef, ready, insert, confidence_threshold)
+            errors.extend(batch_errors)
+            failed = {e.file_path for e in batch_errors}
+            for prepared in ready:
+                if prepared.file_path not in failed:
+                    logger.info(
+                        "File load completed",
+                        extra={"table": tdef.table.name, "file": prepared.file_path},
+                    )
     finally:
-        if is_tmp:
-            Path(resolved_path).unlink(missing_ok=True)
+        for tmp_path in tmp_paths:
+            Path(tmp_path).unlink(missing_ok=True)
+    return errors
+
+
+def list_source_files(source_dir: str | Path) -> list[os.DirEntry[str]]:
+    """Return the non-hidden regular files in source_dir, sorted by name.
+
+    These are the files load_files considers, before the extension filter.
+    DirEntry carries the name, full path and cached file type, avoiding a
+    Path object and a stat call per file.
+    """
+    with os.scandir(source_dir) as it:
+        files = [e for e in it if not e.name.startswith(".") and e.is_file()]
+    files.sort(key=lambda e: e.name)
+    return files
 
 
 def load_files(
@@ -377,15 +553,14 @@ def load_files(
 ) -> list[LoadError]:
     """Load all data files from the table's source directory.
 
-    Iterates over files in source_dir, inserting each supported file into
-    the table. Returns a list of LoadError instances for any failures.
+    Iterates over files in source_dir in file-name order, inserting each
+    supported file into the table. Runs of consecutive CSV files with the
+    same encoding, and runs of consecutive Parquet files, are each inserted
+    with one query. Returns a list of LoadError instances for any failures.
     """
     source_dir = Path(tdef.table.source_dir)
     errors: list[LoadError] = []
-
-    files = sorted(
-        f for f in source_dir.iterdir() if f.is_file() and not f.name.startswith(".")
-    )
+    files = list_source_files(source_dir)
 
     if not files:
         return [
@@ -398,9 +573,37 @@ def load_files(
             )
         ]
 
+    # Per-table SQL fragments, built once rather than once per file
+    select_clause, columns_override = _build_insert_clauses(tdef)
+
+    # Consecutive files of the same kind (extension, CSV encoding) are
+    # inserted together; a change of kind or an XLSX file flushes the run
+    # first, so rows are inserted in file-name order.
+    pending: list[_PendingFile] = []
+    pending_kind: tuple[str, str | None] | None = None
+
+    def flush() -> None:
+        nonlocal pending_kind
+        if pending_kind is not None:
+            ext, encoding = pending_kind
+            errors.extend(
+                _flush_batch(
+                    conn,
+                    tdef,
+                    ext,
+                    encoding,
+                    pending,
+                    select_clause,
+                    columns_override,
+                    confidence_threshold,
+                )
+            )
+            pending.clear()
+            pending_kind = None
+
     for file in files:
-        ext = file.suffix.lower()
-        file_str = str(file)
+        ext = os.path.splitext(file.name)[1].lower()
+        file_str = file.path
 
         if ext == ".xls":
             errors.append(
@@ -422,13 +625,39 @@ def load_files(
             "File load started",
             extra={"table": tdef.table.name, "file": file_str},
         )
-        error = _insert_file(conn, tdef, file_str, ext, confidence_threshold)
-        if error:
-            errors.append(error)
-        else:
-            logger.info(
-                "File load completed",
-                extra={"table": tdef.table.name, "file": file_str},
+        if ext == ".xlsx":
+            flush()
+            error = _insert_xlsx_file(
+                conn, tdef, file_str, select_clause, columns_override
             )
+            if error:
+                errors.append(error)
+            else:
+                logger.info(
+                    "File load completed",
+                    extra={"table": tdef.table.name, "file": file_str},
+                )
+            continue
 
+        encoding: str | None = None
+        transcode_from: str | None = None
+        if ext == ".csv":
+            try:
+                encoding, transcode_from = _detect_csv_encoding(
+                    file_str, confidence_threshold
+                )
+            except Exception as e:
+                errors.append(
+                    _load_error_from_exception(tdef, file_str, e, confidence_threshold)
+                )
+                continue
+        if (ext, encoding) != pending_kind:
+            flush()
+            pending_kind = (ext, encoding)
+        pending.append(_PendingFile(file_str, transcode_from))
+    flush()
+
+    # Report errors in file order regardless of which phase produced them
+    file_order = {f.path: i for i, f in enumerate(files)}
+    errors.sort(key=lambda e: file_order.get(e.file_path, -1))
     return errors
@@ -9,33 +9,20 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime
+from typing import TextIO
 
-_RESERVED = {
-    "timestamp",
-    "level",
-    "module",
-    "message",
-    "name",
-    "msg",
-    "args",
-    "created",
-    "filename",
-    "funcName",
-    "levelname",
-    "levelno",
-    "lineno",
-    "msecs",
-    "pathname",
-    "process",
-    "processName",
-    "relativeCreated",
-    "stack_info",
-    "thread",
-    "threadName",
-    "exc_info",
-    "exc_text",
-    "taskName",
-}
+# Keys that are never copied from a record as extra fields: the formatter's
+# own output keys, plus every attribute LogRecord sets itself (taken from a
+# prototype record so new Python versions are covered) and the ones that
+# formatters add.
+_RESERVED: frozenset[str] = frozenset(
+    {"timestamp", "level", "module", "message", "asctime", "taskName"}
+).union(logging.LogRecord("", 0, "", 0, "", None, None).__dict__)
+
+
+# Shared encoder: json.dumps would build a new JSONEncoder on every call
+# because ensure_ascii=False is not the default.
+_ENCODER = json.JSONEncoder(ensure_ascii=False)
 
 
 class JsonFormatter(logging.Formatter):
@@ -49,12 +36,32 @@ class JsonFormatter(logging.Formatter):
             "module": record.module,
             "message": record.getMessage(),
         }
-        for key, value in record.__dict__.items():
-            if key not in _RESERVED:
-                log[key] = value
+        # Most records carry only a handful of extras; the key-view difference
+        # finds them in C, and the ordered walk only runs when there are any.
+        extra_keys = record.__dict__.keys() - _RESERVED
+        if extra_keys:
+            for key, value in record.__dict__.items():
+                if key in extra_keys:
+                    log[key] = value
         if record.exc_info:
             log["exception"] = self.formatException(record.exc_info)
-        return json.dumps(log, ensure_ascii=False)
+        return _ENCODER.encode(log)
+
+
+_handler: logging.StreamHandler[TextIO] | None = None
+
+
+def _get_handler() -> logging.StreamHandler[TextIO]:
+    """Return the stderr handler shared by all tval loggers, creating it once.
+
+    Each record is written as it is emitted so progress stays visible while a
+    run is in flight.
+    """
+    global _handler
+    if _handler is None:
+        _handler = logging.StreamHandler()
+        _handler.setFormatter(JsonFormatter())
+    return _handler
 
 
 def configure_log_level(level: int) -> None:
@@ -68,9 +75,7 @@ def get_logger(name: str) -> logging.Logger:
     """Return a logger configured with JSON formatting."""
     logger = logging.getLogger(name)
     if not logger.handlers:
-        handler = logging.StreamHandler()
-        handler.setFormatter(JsonFormatter())
-        logger.addHandler(handler)
+        logger.addHandler(_get_handler())
         logger.setLevel(logging.DEBUG)
         logger.propagate = False
     return logger
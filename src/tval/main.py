@@ -8,19 +8,31 @@ report generation.
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from itertools import chain
 from pathlib import Path
 
 import duckdb
-import yaml
 
-from .builder import build_load_order, create_tables
+from .builder import build_load_levels, build_load_order, create_tables
 from .checker import CheckResult, run_checks
-from .exporter import ExportResult, export_table
+from .exporter import ExportResult, export_tables
 from .loader import LoadError, load_files
 from .logger import get_logger
-from .parser import ProjectConfig, TableDef, load_table_definitions
+from .manifest import (
+    Fingerprints,
+    compute_fingerprints,
+    read_manifest,
+    write_manifest,
+)
+from .parser import (
+    DuckDBConfig,
+    ProfileConfig,
+    ProjectConfig,
+    TableDef,
+    load_table_definitions,
+    load_yaml,
+)
 from .profiler import profile_table
 from .relation import (
     CrossCheckDef,
@@ -37,12 +49,30 @@ from .status import CheckStatus, ExportStatus
 logger = get_logger(__name__)
 
 
+def _open_duckdb(
+    db_path: Path,
+    *,
+    read_only: bool = False,
+    settings: DuckDBConfig | None = None,
+) -> duckdb.DuckDBPyConnection:
+    """Open a DuckDB connection with the ``duckdb`` settings of config.yaml."""
+    connect_config = settings.connect_config() if settings is not None else {}
+    return duckdb.connect(str(db_path), read_only=read_only, config=connect_config)
+
+
 def _connect_duckdb(
-    db_path: Path, *, read_only: bool = False
+    db_path: Path,
+    *,
+    read_only: bool = False,
+    settings: DuckDBConfig | None = None,
 ) -> duckdb.DuckDBPyConnection:
-    """Open a DuckDB connection, converting failures to SystemExit(1)."""
+    """Open a DuckDB connection, converting failures to SystemExit(1).
+
+    ``settings`` carries the ``duckdb`` section of config.yaml; an invalid
+    value (e.g. a malformed memory_limit) fails here like any other open error.
+    """
     try:
-        return duckdb.connect(str(db_path), read_only=read_only)
+        return _open_duckdb(db_path, read_only=read_only, settings=settings)
     except duckdb.IOException as e:
         logger.error(
             "Failed to open database (I/O error): %s",
@@ -55,6 +85,23 @@ def _connect_duckdb(
         raise SystemExit(1) from e
 
 
+def _read_existing_manifest(
+    db_path: Path, settings: DuckDBConfig
+) -> Fingerprints | None:
+    """Return the manifest of an existing database, or None if it is unusable.
+
+    An unreadable database is not an error here: it is simply rebuilt.
+    """
+    if not db_path.exists():
+        return None
+    try:
+        with _open_duckdb(db_path, read_only=True, settings=settings) as conn:
+            return read_manifest(conn)
+    except duckdb.Error as e:
+        logger.info("No usable manifest in database", extra={"error": str(e)})
+        return None
+
+
 def _validate_output_dirs(db_path: Path, output_path: Path) -> None:
     """Ensure parent directories for db and output are writable, creating as needed."""
     for label, path in [("database_path", db_path), ("output_path", output_path)]:
@@ -78,60 +125,109 @@ def _discover_config_path(config_path: str | None) -> str:
     """Auto-discover config.yaml if not specified."""
     if config_path is not None:
         return config_path
-    for candidate in ["./tval/config.yaml", "./config.yaml"]:
-        if Path(candidate).exists():
+    for candidate in ("./tval/config.yaml", "./config.yaml"):
+        if os.path.isfile(candidate):
             return candidate
     raise FileNotFoundError(
         "config.yaml not found. Specify with --config or create ./tval/config.yaml."
     )
 
 
+def _load_table_files(
+    cursor: duckdb.DuckDBPyConnection,
+    tdef: TableDef,
+    confidence_threshold: float,
+) -> list[LoadError]:
+    """Load one table's files on a dedicated cursor, closing it afterwards."""
+    with cursor:
+        return load_files(cursor, tdef, confidence_threshold=confidence_threshold)
+
+
 def _load_data(
     conn: duckdb.DuckDBPyConnection,
     ordered_defs: list[TableDef],
     confidence_threshold: float,
 ) -> dict[str, list[LoadError]]:
-    """Create tables and load all files, returning errors by table name."""
+    """Create tables and load all files, returning errors by table name.
+
+    Tables are loaded one foreign-key dependency level at a time. Tables
+    within a level do not reference each other, so they load concurrently,
+    each on its own DuckDB cursor. A single-table level (e.g. every level of
+    a linear FK chain) loads inline without a thread pool.
+    """
     create_tables(conn, ordered_defs)
     all_load_errors: dict[str, list[LoadError]] = {}
-    for tdef in ordered_defs:
-        load_errors = load_files(conn, tdef, confidence_threshold=confidence_threshold)
-        all_load_errors[tdef.table.name] = load_errors
-    return all_load_errors
+    for level in build_load_levels(ordered_defs):
+        if len(level) == 1:
+            tdef = level[0]
+            all_load_errors[tdef.table.name] = _load_table_files(
+                conn.cursor(), tdef, confidence_threshold
+            )
+            continue
+        max_workers = min(len(level), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _load_table_files, conn.cursor(), tdef, confidence_threshold
+                )
+                for tdef in level
+            ]
+            for tdef, future in zip(level, futures, strict=True):
+                all_load_errors[tdef.table.name] = future.result()
+    # Keep the result in load order regardless of level grouping
+    return {t.table.name: all_load_errors[t.table.name] for t in ordered_defs}
+
+
+def _build_table_report(
+    cursor: duckdb.DuckDBPyConnection,
+    tdef: TableDef,
+    load_errors: list[LoadError],
+    profile_options: ProfileConfig | None = None,
+) -> TableReport:
+    """Run checks and profiling for one table on a dedicated cursor.
+
+    The cursor is closed afterwards. Profiling is skipped (early termination)
+    if any check failed.
+    """
+    with cursor:
+        check_results, agg_check_results = run_checks(cursor, tdef, load_errors)
+        report = TableReport(
+            table_def=tdef,
+            load_errors=load_errors,
+            check_results=check_results,
+            agg_check_results=agg_check_results,
+            profiles=[],
+            export_result=None,
+        )
+        if not report.has_check_failure:
+            report.profiles = profile_table(cursor, tdef, load_errors, profile_options)
+    return report
 
 
 def _build_table_reports(
     conn: duckdb.DuckDBPyConnection,
     ordered_defs: list[TableDef],
     all_load_errors: dict[str, list[LoadError]],
+    profile_options: ProfileConfig | None = None,
 ) -> list[TableReport]:
-    """Run checks and profiling for each table, returning reports."""
-    table_reports: list[TableReport] = []
-    for tdef in ordered_defs:
-        load_errors = all_load_errors[tdef.table.name]
-        check_results, agg_check_results = run_checks(conn, tdef, load_errors)
-
-        # Early termination: skip profiling if any check failed
-        has_check_failure = any(
-            cr.status in (CheckStatus.NG, CheckStatus.ERROR)
-            for cr in chain(check_results, agg_check_results)
-        )
-        if has_check_failure:
-            profiles = []
-        else:
-            profiles = profile_table(conn, tdef, load_errors)
-
-        table_reports.append(
-            TableReport(
-                table_def=tdef,
-                load_errors=load_errors,
-                check_results=check_results,
-                agg_check_results=agg_check_results,
-                profiles=profiles,
-                export_result=None,
+    """Run checks and profiling for each table, returning reports.
+
+    Tables are independent and only read, so each table's checks and profile
+    run concurrently on its own DuckDB cursor. Results keep table order.
+    """
+    max_workers = max(1, min(len(ordered_defs), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _build_table_report,
+                conn.cursor(),
+                tdef,
+                all_load_errors[tdef.table.name],
+                profile_options,
             )
-        )
-    return table_reports
+            for tdef in ordered_defs
+        ]
+        return [future.result() for future in futures]
 
 
 def _log_dry_run_summary(
@@ -180,8 +276,7 @@ def run(
 
     resolved_path = _discover_config_path(config_path)
 
-    with open(resolved_path, encoding="utf-8") as f:
-        raw_config = yaml.safe_load(f)
+    raw_config = load_yaml(resolved_path)
     config = ProjectConfig.model_validate(raw_config)
 
     # Resolve paths relative to config.yaml's parent directory
@@ -193,7 +288,12 @@ def run(
     _validate_output_dirs(db_path, output_path_cfg)
 
     # Load schema YAML files
-    table_defs = load_table_definitions(str(schema_dir), project_root=project_root)
+    schema_cache = (
+        project_root / config.schema_cache_path if config.schema_cache_path else None
+    )
+    table_defs = load_table_definitions(
+        str(schema_dir), project_root=project_root, cache_path=schema_cache
+    )
 
     # Load relations and cross_checks (optional)
     relations: list[RelationDef] = []
@@ -215,29 +315,46 @@ def run(
         _log_dry_run_summary(ordered_defs, relations, cross_checks)
         return
 
-    # Connect to DuckDB (delete and recreate existing file)
-    if db_path.exists():
-        db_path.unlink()
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    with _connect_duckdb(db_path) as conn_rw:
-        all_load_errors = _load_data(
-            conn_rw, ordered_defs, config.encoding_confidence_threshold
+    # Incremental mode reuses the database when nothing it was built from
+    # has changed; otherwise the file is deleted and rebuilt.
+    fingerprints = (
+        compute_fingerprints(ordered_defs, config.encoding_confidence_threshold)
+        if config.incremental
+        else None
+    )
+    if (
+        fingerprints is not None
+        and _read_existing_manifest(db_path, config.duckdb) == fingerprints
+    ):
+        logger.info(
+            "Schemas and source files unchanged, reusing database",
+            extra={"db_path": str(db_path)},
         )
+        all_load_errors: dict[str, list[LoadError]] = {
+            tdef.table.name: [] for tdef in ordered_defs
+        }
+    else:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        db_path.unlink(missing_ok=True)
+        with _connect_duckdb(db_path, settings=config.duckdb) as conn_rw:
+            all_load_errors = _load_data(
+                conn_rw, ordered_defs, config.encoding_confidence_threshold
+            )
+            # Only a clean load may be reused: load errors are not persisted
+            if fingerprints is not None and not any(all_load_errors.values()):
+                write_manifest(conn_rw, fingerprints)
 
-    # Run checks/profiler on a read-only connection
+    # Run checks/profiler and export on one shared read-only connection
     relation_check_results: list[CheckResult] = []
     cross_check_results: list[CheckResult] = []
-    with _connect_duckdb(db_path, read_only=True) as conn_ro:
-        table_reports = _build_table_reports(conn_ro, ordered_defs, all_load_errors)
+    with _connect_duckdb(db_path, read_only=True, settings=config.duckdb) as conn_ro:
+        table_reports = _build_table_reports(
+            conn_ro, ordered_defs, all_load_errors, config.profile
+        )
 
         # Collect tables with check failures for relation skip
         check_failed_tables = {
-            r.table_def.table.name
-            for r in table_reports
-            if any(
-                cr.status in (CheckStatus.NG, CheckStatus.ERROR)
-                for cr in chain(r.check_results, r.agg_check_results)
-            )
+            r.table_def.table.name for r in table_reports if r.has_check_failure
         }
 
         if relations:
@@ -250,30 +367,31 @@ def run(
                 conn_ro, cross_checks, all_load_errors, check_failed_tables
             )
 
-    # Export
-    if export:
-        tables_ok = all(r.overall_status == CheckStatus.OK for r in table_reports)
-        relations_ok = all(
-            r.status in (CheckStatus.OK, CheckStatus.SKIPPED)
-            for r in relation_check_results
-        )
-        cross_ok = all(
-            r.status in (CheckStatus.OK, CheckStatus.SKIPPED)
-            for r in cross_check_results
-        )
-        all_ok = tables_ok and relations_ok and cross_ok
-        output_base_dir = output_path_cfg.parent / "parquet"
-        with _connect_duckdb(db_path, read_only=True) as conn_ro:
-            for report, tdef in zip(table_reports, ordered_defs, strict=True):
-                if not all_ok:
-                    report.export_result = ExportResult(
+        # Export
+        if export:
+            all_ok = all(
+                r.overall_status == CheckStatus.OK for r in table_reports
+            ) and all(
+                r.status in (CheckStatus.OK, CheckStatus.SKIPPED)
+                for r in (*relation_check_results, *cross_check_results)
+            )
+            output_base_dir = output_path_cfg.parent / "parquet"
+            if all_ok:
+                export_results = export_tables(conn_ro, ordered_defs, output_base_dir)
+            else:
+                export_results = [
+                    ExportResult(
                         table_name=tdef.table.name,
                         status=ExportStatus.SKIPPED,
                         output_path="",
                         message="Skipped because tables with validation failures exist",
                     )
-                else:
-                    report.export_result = export_table(conn_ro, tdef, output_base_dir)
+                    for tdef in ordered_defs
+                ]
+            for report, export_result in zip(
+                table_reports, export_results, strict=True
+            ):
+                report.export_result = export_result
 
     # Generate report
     output_path_cfg.parent.mkdir(parents=True, exist_ok=True)
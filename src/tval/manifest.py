@@ -0,0 +1,84 @@
+"""Track what a DuckDB file was built from, for incremental runs.
+
+Fingerprints each table's schema definition and source files, stores them in
+a manifest table inside the database (in its own schema, apart from the user's
+tables) after a clean load, and compares them on the next run so an unchanged
+database can be reused instead of rebuilt.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+import duckdb
+
+from .loader import list_source_files
+from .logger import get_logger
+from .parser import TableDef
+
+logger = get_logger(__name__)
+
+MANIFEST_SCHEMA = "_tval"
+MANIFEST_TABLE = f"{MANIFEST_SCHEMA}.manifest"
+
+# table name -> (schema hash, source files fingerprint)
+Fingerprints = dict[str, tuple[str, str]]
+
+
+def _schema_hash(tdef: TableDef, confidence_threshold: float) -> str:
+    """Hash the validated table definition together with the load settings."""
+    payload = f"{tdef.model_dump_json()}\n{confidence_threshold!r}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _files_fingerprint(source_dir: str) -> str:
+    """Hash the name, mtime and size of every file the loader would see."""
+    digest = hashlib.sha256()
+    try:
+        for e in list_source_files(source_dir):
+            st = e.stat()
+            digest.update(f"{e.name}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+    except OSError:
+        return ""
+    return digest.hexdigest()
+
+
+def compute_fingerprints(
+    table_defs: list[TableDef], confidence_threshold: float
+) -> Fingerprints:
+    """Fingerprint each table's schema definition and source files."""
+    return {
+        tdef.table.name: (
+            _schema_hash(tdef, confidence_threshold),
+            _files_fingerprint(tdef.table.source_dir),
+        )
+        for tdef in table_defs
+    }
+
+
+def read_manifest(conn: duckdb.DuckDBPyConnection) -> Fingerprints | None:
+    """Return the fingerprints stored in the connected database, if any."""
+    try:
+        rows = conn.execute(
+            f"SELECT table_name, schema_hash, files_fingerprint FROM {MANIFEST_TABLE}"
+        ).fetchall()
+    except duckdb.Error as e:
+        logger.info("No usable manifest in database", extra={"error": str(e)})
+        return None
+    return {name: (schema_hash, files) for name, schema_hash, files in rows}
+
+
+def write_manifest(conn: duckdb.DuckDBPyConnection, fingerprints: Fingerprints) -> None:
+    """Store the fingerprints of a cleanly loaded database."""
+    conn.execute(f"CREATE SCHEMA IF NOT EXISTS {MANIFEST_SCHEMA}")
+    conn.execute(
+        f"CREATE OR REPLACE TABLE {MANIFEST_TABLE} ("
+        "table_name VARCHAR, schema_hash VARCHAR, files_fingerprint VARCHAR)"
+    )
+    conn.executemany(
+        f"INSERT INTO {MANIFEST_TABLE} VALUES (?, ?, ?)",
+        [
+            (name, schema_hash, files)
+            for name, (schema_hash, files) in fingerprints.items()
+        ],
+    )
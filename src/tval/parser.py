@@ -6,37 +6,106 @@ definitions and provides functions to load them from YAML files.
 
 from __future__ import annotations
 
+import json
+import os
 import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import BaseModel, ValidationInfo, field_validator, model_validator
-
-DATETIME_TYPES = {"DATE", "TIMESTAMP", "TIME"}
-
-NUMERIC_TYPES = {
-    "INTEGER",
-    "INT",
-    "INT4",
-    "INT32",
-    "BIGINT",
-    "INT8",
-    "INT64",
-    "SMALLINT",
-    "INT2",
-    "INT16",
-    "TINYINT",
-    "INT1",
-    "HUGEINT",
-    "FLOAT",
-    "FLOAT4",
-    "REAL",
-    "DOUBLE",
-    "FLOAT8",
-    "DECIMAL",
-    "NUMERIC",
-}
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    TypeAdapter,
+    ValidationError,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
+from pydantic_core import InitErrorDetails
+
+from .logger import get_logger
+
+try:  # libyaml-backed loader; same safe semantics as yaml.SafeLoader
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+logger = get_logger(__name__)
+
+# Safe strptime-style format patterns (ColumnDef.format).
+_FORMAT_RE = re.compile(r"[%A-Za-z0-9\-/.: ]+")
+
+DATETIME_TYPES: frozenset[str] = frozenset({"DATE", "TIMESTAMP", "TIME"})
+
+NUMERIC_TYPES: frozenset[str] = frozenset(
+    {
+        "INTEGER",
+        "INT",
+        "INT4",
+        "INT32",
+        "BIGINT",
+        "INT8",
+        "INT64",
+        "SMALLINT",
+        "INT2",
+        "INT16",
+        "TINYINT",
+        "INT1",
+        "HUGEINT",
+        "FLOAT",
+        "FLOAT4",
+        "REAL",
+        "DOUBLE",
+        "FLOAT8",
+        "DECIMAL",
+        "NUMERIC",
+    }
+)
+
+
+def base_type_name(col_type: str) -> str:
+    """Return a column type without its precision suffix, e.g. DECIMAL(10,2)."""
+    if "(" not in col_type:
+        return col_type.strip()
+    return col_type.split("(", 1)[0].strip()
+
+
+class ProfileConfig(BaseModel):
+    """Profiling options under the ``profile`` key of config.yaml."""
+
+    approx_unique: bool = False
+    approx_quantiles: bool = False
+    include_moments: bool = True
+
+
+class DuckDBConfig(BaseModel):
+    """DuckDB settings under the ``duckdb`` key of config.yaml.
+
+    Unset values keep DuckDB's defaults (all cores, 80% of system memory).
+    """
+
+    threads: int | None = None
+    memory_limit: str | None = None
+
+    @field_validator("threads")
+    @classmethod
+    def validate_threads(cls, v: int | None) -> int | None:
+        """Ensure threads is a positive count."""
+        if v is not None and v < 1:
+            raise ValueError(f"threads must be >= 1: {v}")
+        return v
+
+    def connect_config(self) -> dict[str, Any]:
+        """Return the settings to pass as ``duckdb.connect(config=...)``."""
+        settings: dict[str, Any] = {}
+        if self.threads is not None:
+            settings["threads"] = self.threads
+        if self.memory_limit is not None:
+            settings["memory_limit"] = self.memory_limit
+        return settings
 
 
 class ProjectConfig(BaseModel):
@@ -47,6 +116,10 @@ class ProjectConfig(BaseModel):
     output_path: str
     encoding_confidence_threshold: float = 0.8
     relations_path: str | None = None
+    schema_cache_path: str | None = None
+    incremental: bool = False
+    profile: ProfileConfig = ProfileConfig()
+    duckdb: DuckDBConfig = DuckDBConfig()
 
     @field_validator("database_path")
     @classmethod
@@ -82,7 +155,7 @@ class ColumnDef(BaseModel):
         """Restrict format to safe strptime-style patterns only."""
         if v is None:
             return v
-        if not re.fullmatch(r"[%A-Za-z0-9\-/.: ]+", v):
+        if not _FORMAT_RE.fullmatch(v):
             raise ValueError(f"Invalid format pattern: {v!r}")
         return v
 
@@ -90,8 +163,7 @@ class ColumnDef(BaseModel):
     def validate_format_type(self) -> ColumnDef:
         """Ensure the format field is only used with DATE/TIMESTAMP/TIME types."""
         if self.format is not None:
-            base_type = self.type.split("(")[0].strip()
-            if base_type not in DATETIME_TYPES:
+            if base_type_name(self.type) not in DATETIME_TYPES:
                 raise ValueError(
                     "format is only valid for DATE/TIMESTAMP/TIME types: "
                     f"type={self.type}"
@@ -102,8 +174,7 @@ class ColumnDef(BaseModel):
     def validate_min_max_type(self) -> ColumnDef:
         """Ensure min/max fields are only used with numeric types."""
         if self.min is not None or self.max is not None:
-            base_type = self.type.split("(")[0].strip()
-            if base_type not in NUMERIC_TYPES:
+            if base_type_name(self.type) not in NUMERIC_TYPES:
                 raise ValueError(
                     f"min/max is only valid for numeric types: type={self.type}"
                 )
@@ -115,18 +186,24 @@ class ColumnDef(BaseModel):
 class PrimaryKeyDef(BaseModel):
     """Primary key constraint definition."""
 
+    model_config = ConfigDict(frozen=True)
+
     columns: list[str]
 
 
 class UniqueDef(BaseModel):
     """Unique constraint definition."""
 
+    model_config = ConfigDict(frozen=True)
+
     columns: list[str]
 
 
 class FKReference(BaseModel):
     """Foreign key reference target (table and columns)."""
 
+    model_config = ConfigDict(frozen=True)
+
     table: str
     columns: list[str]
 
@@ -134,6 +211,8 @@ class FKReference(BaseModel):
 class ForeignKeyDef(BaseModel):
     """Foreign key constraint definition."""
 
+    model_config = ConfigDict(frozen=True)
+
     columns: list[str]
     references: FKReference
 
@@ -150,6 +229,8 @@ class CheckDef(BaseModel):
 class RowConditionDef(BaseModel):
     """Declarative row-level condition expressed as a SQL boolean expression."""
 
+    model_config = ConfigDict(frozen=True)
+
     description: str
     condition: str
 
@@ -176,6 +257,8 @@ class TableConstraints(BaseModel):
 class ExportDef(BaseModel):
     """Export configuration for a table (e.g. Parquet partitioning)."""
 
+    model_config = ConfigDict(frozen=True)
+
     partition_by: list[str] = []
 
 
@@ -187,41 +270,60 @@ class TableMeta(BaseModel):
     source_dir: str
 
 
-def _validate_source_dir(source_dir_str: str, project_root: str | None) -> None:
-    """Validate that source_dir exists and is within project root."""
-    source_dir = Path(source_dir_str)
-    if not source_dir.exists():
+def _validate_source_dir(
+    source_dir_str: str,
+    root: str | None,
+    resolved_dirs: dict[str, str | None] | None = None,
+) -> None:
+    """Validate that source_dir exists and is within the project root.
+
+    ``root`` is the project root's real path. ``resolved_dirs`` memoizes each
+    source_dir's real path (None if missing) for the duration of one load,
+    since many tables can share a directory.
+    """
+    if resolved_dirs is None:
+        resolved_dirs = {}
+    if source_dir_str in resolved_dirs:
+        resolved = resolved_dirs[source_dir_str]
+    else:
+        resolved = (
+            os.path.realpath(source_dir_str) if os.path.exists(source_dir_str) else None
+        )
+        resolved_dirs[source_dir_str] = resolved
+    if resolved is None:
         raise ValueError(f"source_dir does not exist: {source_dir_str}")
-    if project_root is not None:
-        resolved = source_dir.resolve()
-        root_resolved = Path(project_root).resolve()
+    if root is not None:
         try:
-            resolved.relative_to(root_resolved)
-        except ValueError:
+            inside = os.path.commonpath((resolved, root)) == root
+        except ValueError:  # e.g. different drives on Windows
+            inside = False
+        if not inside:
             raise ValueError(
                 f"source_dir must be under the project root: {source_dir_str}"
-            ) from None
+            )
+
+
+def _check_columns_exist(
+    col_names: frozenset[str], columns: list[str], where: str
+) -> None:
+    """Raise listing every column in ``columns`` that is not in the table."""
+    if col_names.issuperset(columns):
+        return
+    missing = [c for c in columns if c not in col_names]
+    raise ValueError(f"Column not found in {where}: {', '.join(missing)}")
 
 
 def _validate_constraint_columns(
-    col_names: set[str], constraints: "TableConstraints", export: ExportDef
+    col_names: frozenset[str], constraints: "TableConstraints", export: ExportDef
 ) -> None:
     """Validate that all constraint-referenced columns exist in the table."""
     for pk in constraints.primary_key:
-        for col in pk.columns:
-            if col not in col_names:
-                raise ValueError(f"Column not found in primary_key: {col}")
+        _check_columns_exist(col_names, pk.columns, "primary_key")
     for uq in constraints.unique:
-        for col in uq.columns:
-            if col not in col_names:
-                raise ValueError(f"Column not found in unique: {col}")
+        _check_columns_exist(col_names, uq.columns, "unique")
     for fk in constraints.foreign_keys:
-        for col in fk.columns:
-            if col not in col_names:
-                raise ValueError(f"Column not found in foreign_keys: {col}")
-    for col in export.partition_by:
-        if col not in col_names:
-            raise ValueError(f"Column not found in export.partition_by: {col}")
+        _check_columns_exist(col_names, fk.columns, "foreign_keys")
+    _check_columns_exist(col_names, export.partition_by, "export.partition_by")
 
 
 class TableDef(BaseModel):
@@ -241,7 +343,7 @@ class TableDef(BaseModel):
         if len(obj.columns) == 0:
             raise ValueError("At least one column is required")
 
-        col_names = {c.name for c in obj.columns}
+        col_names = frozenset(c.name for c in obj.columns)
         if len(col_names) != len(obj.columns):
             seen: set[str] = set()
             for c in obj.columns:
@@ -250,31 +352,204 @@ class TableDef(BaseModel):
                 seen.add(c.name)
 
         context = info.context or {}
-        project_root: str | None = context.get("project_root")
-        _validate_source_dir(obj.table.source_dir, project_root)
+        root: str | None = context.get("resolved_root")
+        project_root: str | Path | None = context.get("project_root")
+        if root is None and project_root is not None:
+            root = os.path.realpath(project_root)
+        _validate_source_dir(obj.table.source_dir, root, context.get("resolved_dirs"))
         _validate_constraint_columns(col_names, obj.table_constraints, obj.export)
 
         return obj
 
 
+def load_yaml(path: str | Path) -> Any:
+    """Parse a YAML file with the safe loader, preferring the libyaml C build.
+
+    The file is read in one go and the bytes are handed to the parser, which
+    decodes them itself (UTF-8 unless a BOM says otherwise).
+    """
+    return yaml.load(Path(path).read_bytes(), Loader=_YamlLoader)
+
+
+# Validates a whole schema directory in one call instead of one per file
+_TABLE_DEFS_ADAPTER: TypeAdapter[list[TableDef]] = TypeAdapter(list[TableDef])
+
+
+def _validation_context(project_root: str | Path | None) -> dict[str, Any]:
+    """Build the Pydantic validation context for TableDef.
+
+    A fresh ``resolved_dirs`` memo is shared by every file of one load, and
+    the project root is resolved once here for all of them.
+    """
+    context: dict[str, Any] = {"resolved_dirs": {}}
+    if project_root is not None:
+        context["project_root"] = project_root
+        context["resolved_root"] = os.path.realpath(project_root)
+    return context
+
+
+def _validate_table_defs(
+    docs: list[Any], file_names: list[str], context: dict[str, Any]
+) -> list[TableDef]:
+    """Validate parsed schema files in one call, locating errors by file name.
+
+    Raises:
+        ValidationError: With the list index leading each error location
+            replaced by the name of the schema file it came from.
+    """
+    try:
+        return _TABLE_DEFS_ADAPTER.validate_python(docs, context=context)
+    except ValidationError as e:
+        details: list[InitErrorDetails] = []
+        for err in e.errors():
+            index, *rest = err["loc"]
+            name = file_names[index] if isinstance(index, int) else index
+            detail: InitErrorDetails = {
+                "type": err["type"],
+                "loc": (name, *rest),
+                "input": err["input"],
+            }
+            if "ctx" in err:
+                detail["ctx"] = err["ctx"]
+            details.append(detail)
+        raise ValidationError.from_exception_data(e.title, details) from None
+
+
 def load_table_definition(
     path: str | Path, project_root: str | Path | None = None
 ) -> TableDef:
     """Load a single YAML schema file and return a validated TableDef."""
-    with open(path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-    context: dict[str, Any] = {}
-    if project_root is not None:
-        context["project_root"] = project_root
-    return TableDef.model_validate(data, context=context)
+    data = load_yaml(path)
+    return TableDef.model_validate(data, context=_validation_context(project_root))
+
+
+def _list_schema_files(schema_dir: str | Path) -> list[os.DirEntry[str]]:
+    """Return the ``*.yaml`` files directly under schema_dir, sorted by name.
+
+    A missing directory yields an empty list, like an empty one.
+    """
+    try:
+        with os.scandir(schema_dir) as it:
+            entries = [e for e in it if e.name.endswith(".yaml") and e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+
+def _schema_manifest(entries: list[os.DirEntry[str]]) -> list[list[Any]]:
+    """Return the (path, mtime_ns, size) fingerprint of each schema file."""
+    manifest: list[list[Any]] = []
+    for e in entries:
+        st = e.stat()
+        manifest.append([e.path, st.st_mtime_ns, st.st_size])
+    return manifest
+
+
+# Bumped whenever the layout or meaning of the cached data changes
+_SCHEMA_CACHE_VERSION = 1
+
+
+def _read_schema_cache(cache_path: Path, manifest: list[list[Any]]) -> list[Any] | None:
+    """Return the cached YAML documents if the cache matches the manifest."""
+    try:
+        cached = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(cached, dict)
+        or cached.get("version") != _SCHEMA_CACHE_VERSION
+        or cached.get("manifest") != manifest
+    ):
+        return None
+    tables = cached.get("tables")
+    return tables if isinstance(tables, list) else None
+
+
+def _write_schema_cache(
+    cache_path: Path, manifest: list[list[Any]], docs: list[Any]
+) -> None:
+    """Atomically write the schema cache; failures only cost the next run.
+
+    The raw YAML documents are cached, not the validated models, so a cache
+    hit goes through the same validation as a cold load. Documents that JSON
+    cannot reproduce exactly (e.g. YAML dates in check params) are not
+    cached, since reading them back would change their types.
+    """
+    payload = {
+        "version": _SCHEMA_CACHE_VERSION,
+        "manifest": manifest,
+        "tables": docs,
+    }
+    try:
+        encoded = json.dumps(payload, ensure_ascii=False)
+    except (TypeError, ValueError):
+        encoded = None
+    if encoded is None or json.loads(encoded)["tables"] != docs:
+        logger.debug(
+            "Schema cache skipped: YAML values are not JSON-native",
+            extra={"path": str(cache_path)},
+        )
+        return
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(encoded)
+            os.replace(tmp, cache_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError as e:
+        logger.warning(
+            "Failed to write schema cache",
+            extra={"path": str(cache_path), "error": str(e)},
+        )
+
+
+def _read_schema_files(yaml_files: list[str]) -> list[Any]:
+    """Read and parse schema files concurrently, preserving their order."""
+    if len(yaml_files) == 1:
+        return [load_yaml(yaml_files[0])]
+    max_workers = min(len(yaml_files), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(load_yaml, yaml_files))
 
 
 def load_table_definitions(
-    schema_dir: str | Path, project_root: str | Path | None = None
+    schema_dir: str | Path,
+    project_root: str | Path | None = None,
+    cache_path: str | Path | None = None,
 ) -> list[TableDef]:
-    """Load all YAML schema files from a directory and return a list of TableDefs."""
-    schema_path = Path(schema_dir)
-    yaml_files = sorted(schema_path.glob("*.yaml"))
-    if not yaml_files:
+    """Load all YAML schema files from a directory and return a list of TableDefs.
+
+    Files are read and parsed on a thread pool, then validated together in a
+    single ``TypeAdapter(list[TableDef])`` call. Results keep the sorted file
+    order. A YAML syntax error raises for the first bad file; a
+    ValidationError reports every invalid file, located by its file name.
+
+    When cache_path is given, the parsed YAML documents are stored there as
+    JSON keyed by each file's path, mtime and size. A matching cache skips
+    reading and parsing the YAML files, but the cached data is still
+    validated, so source_dir and constraint checks run on every load.
+    """
+    entries = _list_schema_files(schema_dir)
+    if not entries:
         raise FileNotFoundError(f"No YAML files found in schema_dir: {schema_dir}")
-    return [load_table_definition(f, project_root=project_root) for f in yaml_files]
+
+    context = _validation_context(project_root)
+    file_names = [e.name for e in entries]
+    manifest: list[list[Any]] = []
+    if cache_path is not None:
+        cache_path = Path(cache_path)
+        manifest = _schema_manifest(entries)
+        cached = _read_schema_cache(cache_path, manifest)
+        if cached is not None:
+            return _validate_table_defs(cached, file_names, context)
+
+    docs = _read_schema_files([e.path for e in entries])
+    table_defs = _validate_table_defs(docs, file_names, context)
+    if cache_path is not None:
+        _write_schema_cache(cache_path, manifest, docs)
+    return table_defs
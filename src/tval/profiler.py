@@ -7,31 +7,41 @@ For date/time columns, collects min and max only.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
 
 import duckdb
 
 from .builder import quote_identifier
 from .loader import LoadError
 from .logger import get_logger
-from .parser import DATETIME_TYPES, NUMERIC_TYPES, TableDef
+from .parser import (
+    DATETIME_TYPES,
+    NUMERIC_TYPES,
+    ColumnDef,
+    ProfileConfig,
+    TableDef,
+    base_type_name,
+)
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1024)
 def _is_numeric(col_type: str) -> bool:
     """Check whether a column type is numeric based on its base type name."""
-    base_type = col_type.split("(")[0].strip()
-    return base_type in NUMERIC_TYPES
+    return base_type_name(col_type) in NUMERIC_TYPES
 
 
+@lru_cache(maxsize=1024)
 def _is_temporal(col_type: str) -> bool:
     """Check whether a column type is a date/time type based on its base type name."""
-    base_type = col_type.split("(")[0].strip()
-    return base_type in DATETIME_TYPES
+    return base_type_name(col_type) in DATETIME_TYPES
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnProfile:
     """Descriptive statistics for a single table column."""
 
@@ -53,120 +63,221 @@ class ColumnProfile:
     p75: float | None
     max: float | str | None
     error: str | None = None
+    unique_count_is_approx: bool = False
+    quantiles_are_approx: bool = False
 
 
-def profile_table(
-    conn: duckdb.DuckDBPyConnection,
-    tdef: TableDef,
-    load_errors: list[LoadError],
-) -> list[ColumnProfile]:
-    """Compute descriptive statistics for all columns in a table.
+def _bounds_exprs(qcol: str) -> list[str]:
+    """Return the streaming aggregates of one column: non-null count, min, max."""
+    return [f"COUNT({qcol})", f"MIN({qcol})", f"MAX({qcol})"]
 
-    Returns an empty list if there are load errors or the table is empty.
-    For numeric columns, includes mean, std, skewness, kurtosis, and percentiles.
+
+def _spread_exprs(qcol: str, numeric: bool, options: ProfileConfig) -> list[str]:
+    """Return the aggregates of one column that need a hash set or a sort.
+
+    Always a distinct count (exact, or HyperLogLog-based approx_count_distinct
+    when ``options.approx_unique``); numeric columns add mean, std, skewness
+    and kurtosis (the last two only when ``options.include_moments``) and
+    quartiles. Quartiles are exact PERCENTILE_CONT values, or T-Digest based
+    approx_quantile estimates when ``options.approx_quantiles``.
     """
-    table_name = tdef.table.name
-    logger.info("Profiling started", extra={"table": table_name})
+    unique_expr = (
+        f"approx_count_distinct({qcol})"
+        if options.approx_unique
+        else f"COUNT(DISTINCT {qcol})"
+    )
+    if not numeric:
+        return [unique_expr]
+    # One aggregate call returns all three quartiles as a list
+    quartiles_expr = (
+        f"approx_quantile({qcol}, [0.25, 0.50, 0.75])"
+        if options.approx_quantiles
+        else f"PERCENTILE_CONT([0.25, 0.50, 0.75]) WITHIN GROUP (ORDER BY {qcol})"
+    )
+    exprs = [unique_expr, f"AVG({qcol})", f"STDDEV_SAMP({qcol})"]
+    if options.include_moments:
+        exprs.extend((f"SKEWNESS({qcol})", f"KURTOSIS({qcol})"))
+    exprs.append(quartiles_expr)
+    return exprs
 
-    if load_errors:
-        logger.info("Profiling completed", extra={"table": table_name})
-        return []
 
-    qtable = quote_identifier(table_name)
+def _constant_spread(
+    numeric: bool, not_null_count: int, value: Any, options: ProfileConfig
+) -> list[Any]:
+    """Return the ``_spread_exprs`` values of an all-null or constant column.
 
-    # Check if table is empty
-    row_count_result = conn.execute(f"SELECT COUNT(*) FROM {qtable}").fetchone()
-    if not row_count_result or row_count_result[0] == 0:
-        logger.info("Profiling completed", extra={"table": table_name})
+    They follow from the bounds alone: no or one distinct value, the value
+    itself as mean and quartiles, and zero deviation (NULL for a single row,
+    as STDDEV_SAMP). Skewness and kurtosis are undefined without variance.
+    """
+    if not numeric:
+        return [min(not_null_count, 1)]
+    moments = [None, None] if options.include_moments else []
+    if not_null_count == 0:
+        return [0, None, None, *moments, None]
+    std = 0.0 if not_null_count > 1 else None
+    return [1, value, std, *moments, [value, value, value]]
+
+
+def _make_profile(
+    col: ColumnDef,
+    numeric: bool,
+    temporal: bool,
+    count: int,
+    bounds: Sequence[Any],
+    spread: Sequence[Any],
+    options: ProfileConfig,
+) -> ColumnProfile:
+    """Build a ColumnProfile from ``_bounds_exprs`` and ``_spread_exprs`` values."""
+    not_null_count, min_raw, max_raw = bounds
+    mean: float | None = None
+    std: float | None = None
+    skewness: float | None = None
+    kurtosis: float | None = None
+    min_val: float | str | None = None
+    p25: float | None = None
+    median_val: float | None = None
+    p75: float | None = None
+    max_val: float | str | None = None
+
+    if numeric:
+        mean, std = _to_float(spread[1]), _to_float(spread[2])
+        if options.include_moments:
+            skewness, kurtosis = _to_float(spread[3]), _to_float(spread[4])
+        # The quartile list is NULL when the column has no non-null values
+        quartiles = spread[-1]
+        if quartiles is not None:
+            p25, median_val, p75 = (_to_float(v) for v in quartiles)
+        min_val = _to_float(min_raw)
+        max_val = _to_float(max_raw)
+    elif temporal:
+        min_val = str(min_raw) if min_raw is not None else None
+        max_val = str(max_raw) if max_raw is not None else None
+
+    return ColumnProfile(
+        column_name=col.name,
+        logical_name=col.logical_name,
+        column_type=col.type,
+        is_numeric=numeric,
+        is_temporal=temporal,
+        count=count,
+        not_null_count=int(not_null_count),
+        unique_count=int(spread[0]),
+        mean=mean,
+        std=std,
+        skewness=skewness,
+        kurtosis=kurtosis,
+        min=min_val,
+        p25=p25,
+        median=median_val,
+        p75=p75,
+        max=max_val,
+        unique_count_is_approx=options.approx_unique,
+        quantiles_are_approx=numeric and options.approx_quantiles,
+    )
+
+
+def _error_profile(
+    col: ColumnDef, numeric: bool, temporal: bool, error: Exception
+) -> ColumnProfile:
+    """Build the placeholder ColumnProfile recorded for a failed column."""
+    return ColumnProfile(
+        column_name=col.name,
+        logical_name=col.logical_name,
+        column_type=col.type,
+        is_numeric=numeric,
+        is_temporal=temporal,
+        count=0,
+        not_null_count=0,
+        unique_count=0,
+        mean=None,
+        std=None,
+        skewness=None,
+        kurtosis=None,
+        min=None,
+        p25=None,
+        median=None,
+        p75=None,
+        max=None,
+        error=str(error),
+    )
+
+
+def _profile_columns_fused(
+    conn: duckdb.DuckDBPyConnection,
+    qtable: str,
+    columns: list[tuple[ColumnDef, str, bool, bool]],
+    options: ProfileConfig,
+) -> list[ColumnProfile]:
+    """Profile all columns with at most two aggregate queries.
+
+    The first query computes the row count and every column's bounds in one
+    streaming pass. The second computes the hash- and sort-based statistics
+    only for columns holding at least two distinct values; all-null and
+    constant columns are completed from their bounds. Returns an empty list
+    for an empty table.
+    """
+    bounds_row = conn.execute(
+        "SELECT COUNT(*), "
+        + ", ".join([e for _, qcol, *_ in columns for e in _bounds_exprs(qcol)])
+        + f" FROM {qtable}"
+    ).fetchone()
+    if not bounds_row or bounds_row[0] == 0:
         return []
+    count = int(bounds_row[0])
+    bounds = [bounds_row[i : i + 3] for i in range(1, len(bounds_row), 3)]
 
-    profiles: list[ColumnProfile] = []
+    # Constant columns are completed here; varying ones are filled in below
+    spreads: list[Sequence[Any]] = []
+    varying: list[tuple[int, list[str]]] = []
+    for i, ((_, qcol, numeric, _), (not_null_count, lo, hi)) in enumerate(
+        zip(columns, bounds, strict=True)
+    ):
+        if not_null_count and lo != hi:
+            spreads.append(())
+            varying.append((i, _spread_exprs(qcol, numeric, options)))
+        else:
+            spreads.append(_constant_spread(numeric, not_null_count, lo, options))
+    if varying:
+        spread_row = conn.execute(
+            "SELECT "
+            + ", ".join([e for _, exprs in varying for e in exprs])
+            + f" FROM {qtable}"
+        ).fetchone()
+        if spread_row:
+            offset = 0
+            for i, exprs in varying:
+                spreads[i] = spread_row[offset : offset + len(exprs)]
+                offset += len(exprs)
+
+    return [
+        _make_profile(col, numeric, temporal, count, col_bounds, spread, options)
+        for (col, _, numeric, temporal), col_bounds, spread in zip(
+            columns, bounds, spreads, strict=True
+        )
+    ]
 
-    for col in tdef.columns:
-        qcol = quote_identifier(col.name)
-        numeric = _is_numeric(col.type)
-        temporal = _is_temporal(col.type)
 
+def _profile_columns_separately(
+    conn: duckdb.DuckDBPyConnection,
+    table_name: str,
+    qtable: str,
+    columns: list[tuple[ColumnDef, str, bool, bool]],
+    options: ProfileConfig,
+) -> list[ColumnProfile]:
+    """Profile each column with its own query, recording per-column errors."""
+    profiles: list[ColumnProfile] = []
+    for col, qcol, numeric, temporal in columns:
+        exprs = _bounds_exprs(qcol) + _spread_exprs(qcol, numeric, options)
         try:
-            # Common statistics
-            common_sql = (
-                f"SELECT COUNT(*) AS count, "
-                f"COUNT({qcol}) AS not_null_count, "
-                f"COUNT(DISTINCT {qcol}) AS unique_count "
-                f"FROM {qtable}"
-            )
-            common_row = conn.execute(common_sql).fetchone()
-            if not common_row:
+            row = conn.execute(
+                f"SELECT COUNT(*), {', '.join(exprs)} FROM {qtable}"
+            ).fetchone()
+            if not row:
                 continue
-            count = int(common_row[0])
-            not_null_count = int(common_row[1])
-            unique_count = int(common_row[2])
-
-            # Numeric / temporal additional statistics
-            mean: float | None = None
-            std: float | None = None
-            skewness: float | None = None
-            kurtosis: float | None = None
-            min_val: float | str | None = None
-            p25: float | None = None
-            median_val: float | None = None
-            p75: float | None = None
-            max_val: float | str | None = None
-
-            if numeric:
-                num_sql = (
-                    f"SELECT "
-                    f"AVG({qcol}) AS mean, "
-                    f"STDDEV_SAMP({qcol}) AS std, "
-                    f"SKEWNESS({qcol}) AS skewness, "
-                    f"KURTOSIS({qcol}) AS kurtosis, "
-                    f"MIN({qcol}) AS min, "
-                    f"PERCENTILE_CONT(0.25) WITHIN GROUP "
-                    f"(ORDER BY {qcol}) AS p25, "
-                    f"PERCENTILE_CONT(0.50) WITHIN GROUP "
-                    f"(ORDER BY {qcol}) AS median, "
-                    f"PERCENTILE_CONT(0.75) WITHIN GROUP "
-                    f"(ORDER BY {qcol}) AS p75, "
-                    f"MAX({qcol}) AS max "
-                    f"FROM {qtable}"
-                )
-                num_row = conn.execute(num_sql).fetchone()
-                if num_row:
-                    mean = _to_float(num_row[0])
-                    std = _to_float(num_row[1])
-                    skewness = _to_float(num_row[2])
-                    kurtosis = _to_float(num_row[3])
-                    min_val = _to_float(num_row[4])
-                    p25 = _to_float(num_row[5])
-                    median_val = _to_float(num_row[6])
-                    p75 = _to_float(num_row[7])
-                    max_val = _to_float(num_row[8])
-            elif temporal:
-                temp_sql = f"SELECT MIN({qcol}), MAX({qcol}) FROM {qtable}"
-                temp_row = conn.execute(temp_sql).fetchone()
-                if temp_row:
-                    min_val = str(temp_row[0]) if temp_row[0] is not None else None
-                    max_val = str(temp_row[1]) if temp_row[1] is not None else None
-
             profiles.append(
-                ColumnProfile(
-                    column_name=col.name,
-                    logical_name=col.logical_name,
-                    column_type=col.type,
-                    is_numeric=numeric,
-                    is_temporal=temporal,
-                    count=count,
-                    not_null_count=not_null_count,
-                    unique_count=unique_count,
-                    mean=mean,
-                    std=std,
-                    skewness=skewness,
-                    kurtosis=kurtosis,
-                    min=min_val,
-                    p25=p25,
-                    median=median_val,
-                    p75=p75,
-                    max=max_val,
+                _make_profile(
+                    col, numeric, temporal, int(row[0]), row[1:4], row[4:], options
                 )
             )
         except Exception as e:
@@ -175,28 +286,56 @@ def profile_table(
                 extra={"table": table_name, "column": col.name},
                 exc_info=True,
             )
-            profiles.append(
-                ColumnProfile(
-                    column_name=col.name,
-                    logical_name=col.logical_name,
-                    column_type=col.type,
-                    is_numeric=numeric,
-                    is_temporal=temporal,
-                    count=0,
-                    not_null_count=0,
-                    unique_count=0,
-                    mean=None,
-                    std=None,
-                    skewness=None,
-                    kurtosis=None,
-                    min=None,
-                    p25=None,
-                    median=None,
-                    p75=None,
-                    max=None,
-                    error=str(e),
-                )
-            )
+            profiles.append(_error_profile(col, numeric, temporal, e))
+    return profiles
+
+
+def profile_table(
+    conn: duckdb.DuckDBPyConnection,
+    tdef: TableDef,
+    load_errors: list[LoadError],
+    options: ProfileConfig | None = None,
+) -> list[ColumnProfile]:
+    """Compute descriptive statistics for all columns in a table.
+
+    Returns an empty list if there are load errors or the table is empty.
+    For numeric columns, includes mean, std, skewness, kurtosis, and percentiles.
+
+    All columns are profiled together (see ``_profile_columns_fused``), so
+    the table is scanned at most twice regardless of its width. If that
+    fails, each column is profiled on its own so the error is attributed to
+    the column that caused it.
+
+    ``options`` carries the ``profile`` settings of config.yaml; the defaults
+    compute exact statistics.
+    """
+    if options is None:
+        options = ProfileConfig()
+    table_name = tdef.table.name
+    logger.info("Profiling started", extra={"table": table_name})
+
+    if load_errors:
+        logger.info("Profiling completed", extra={"table": table_name})
+        return []
+
+    qtable = quote_identifier(table_name)
+    columns = [
+        (col, quote_identifier(col.name), _is_numeric(col.type), _is_temporal(col.type))
+        for col in tdef.columns
+    ]
+    try:
+        profiles = _profile_columns_fused(conn, qtable, columns, options)
+    except Exception:
+        logger.debug(
+            "Fused profiling query failed, profiling per column",
+            extra={"table": table_name},
+        )
+        row_count = conn.execute(f"SELECT COUNT(*) FROM {qtable}").fetchone()
+        profiles = (
+            _profile_columns_separately(conn, table_name, qtable, columns, options)
+            if row_count and row_count[0]
+            else []
+        )
 
     logger.info("Profiling completed", extra={"table": table_name})
     return profiles
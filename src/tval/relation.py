@@ -6,18 +6,19 @@ relationship (1:1, 1:N, N:1, N:N), and returns structured CheckResult instances.
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Literal
 
 import duckdb
-import yaml
 from pydantic import BaseModel, field_validator
 
 from .builder import quote_identifier
 from .checker import CheckResult, make_skipped_result
 from .loader import LoadError
 from .logger import get_logger
-from .parser import CheckDef, TableDef
+from .parser import CheckDef, TableDef, load_yaml
 from .status import CheckStatus
 
 logger = get_logger(__name__)
@@ -64,8 +65,7 @@ class RelationsConfig(BaseModel):
 
 def load_relations(path: str | Path) -> RelationsConfig:
     """Load relations.yaml and return validated RelationsConfig."""
-    with open(path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = load_yaml(path)
     for rel in data.get("relations", []):
         if "from" in rel:
             rel["from_"] = rel.pop("from")
@@ -143,17 +143,22 @@ def _build_referential_sql(
     Finds rows in source_table whose column values have no match in target_table.
     Returns 0 if referential integrity holds (check passes).
     NULLs are excluded (consistent with SQL FK semantics).
+
+    An ANTI JOIN plans as a hash anti join that only probes for a match,
+    instead of building the LEFT JOIN result and filtering it for NULLs.
+    The NULL filter and the key projection sit in a derived table so they
+    apply at the source scan, before the join probes.
     """
     join_cond = " AND ".join(
         f"s.{sc} = t.{tc}" for sc, tc in zip(source_cols, target_cols, strict=True)
     )
-    null_filter = " AND ".join(f"s.{sc} IS NOT NULL" for sc in source_cols)
-    target_null = " AND ".join(f"t.{tc} IS NULL" for tc in target_cols)
+    null_filter = " AND ".join(f"{sc} IS NOT NULL" for sc in source_cols)
 
     return (
-        f"SELECT COUNT(*) FROM {source_table} s "
-        f"LEFT JOIN {target_table} t ON {join_cond} "
-        f"WHERE {null_filter} AND {target_null}"
+        f"SELECT COUNT(*) FROM "
+        f"(SELECT {', '.join(source_cols)} FROM {source_table} "
+        f"WHERE {null_filter}) s "
+        f"ANTI JOIN {target_table} t ON {join_cond}"
     )
 
 
@@ -249,6 +254,103 @@ def _build_relation_checks(rel: RelationDef) -> list[tuple[str, str]]:
     return checks
 
 
+def _count_relation_queries(
+    conn: duckdb.DuckDBPyConnection,
+    rel_name: str,
+    queries: list[str],
+) -> list[int | Exception]:
+    """Run the check queries of one relation as a single statement.
+
+    Each query becomes a scalar subquery of one SELECT, so the relation costs
+    one round trip and one plan. If that statement fails, the queries run one
+    by one so each error is attributed to the query that caused it.
+    """
+    fused_sql = "SELECT " + ", ".join(f"({query})" for query in queries)
+    try:
+        row = conn.execute(fused_sql).fetchone()
+        if row:
+            return [int(v) if v is not None else 0 for v in row]
+    except Exception:
+        logger.debug(
+            "Fused relation query failed, running checks separately",
+            extra={"relation": rel_name},
+        )
+    outcomes: list[int | Exception] = []
+    for query in queries:
+        try:
+            row = conn.execute(query).fetchone()
+            outcomes.append(int(row[0]) if row else 0)
+        except Exception as e:
+            outcomes.append(e)
+    return outcomes
+
+
+def _count_on_cursor(
+    cursor: duckdb.DuckDBPyConnection, rel_name: str, queries: list[str]
+) -> list[int | Exception]:
+    """Count one relation's queries on a dedicated cursor, closing it afterwards."""
+    with cursor:
+        return _count_relation_queries(cursor, rel_name, queries)
+
+
+def _relation_skip_message(
+    rel: RelationDef,
+    all_load_errors: dict[str, list[LoadError]],
+    check_failed: set[str],
+) -> str | None:
+    """Return why a relation's checks are skipped, or None to run them."""
+    skipped_tables = []
+    if all_load_errors.get(rel.from_.table, []):
+        skipped_tables.append(rel.from_.table)
+    if all_load_errors.get(rel.to.table, []):
+        skipped_tables.append(rel.to.table)
+    if rel.from_.table in check_failed:
+        skipped_tables.append(f"{rel.from_.table} (check failed)")
+    if rel.to.table in check_failed:
+        skipped_tables.append(f"{rel.to.table} (check failed)")
+    if not skipped_tables:
+        return None
+    return f"Skipped due to errors in: {', '.join(skipped_tables)}"
+
+
+def _relation_result(
+    rel_name: str, desc: str, query: str, outcome: int | Exception
+) -> CheckResult:
+    """Build the CheckResult of one relation check from its count or error."""
+    if isinstance(outcome, Exception):
+        logger.error(
+            "Relation check execution error",
+            extra={
+                "relation": rel_name,
+                "check_description": desc,
+                "error": str(outcome),
+            },
+        )
+        return CheckResult(
+            description=desc,
+            query=query,
+            status=CheckStatus.ERROR,
+            result_count=None,
+            message=str(outcome),
+        )
+    status = CheckStatus.OK if outcome == 0 else CheckStatus.NG
+    if status is CheckStatus.NG:
+        logger.error(
+            "Relation check failed",
+            extra={
+                "relation": rel_name,
+                "check_description": desc,
+            },
+        )
+    return CheckResult(
+        description=desc,
+        query=query,
+        status=status,
+        result_count=outcome,
+        message="" if status is CheckStatus.OK else f"Result count: {outcome}",
+    )
+
+
 def run_relation_checks(
     conn: duckdb.DuckDBPyConnection,
     relations: list[RelationDef],
@@ -260,75 +362,56 @@ def run_relation_checks(
     If either table in a relation has load errors or check failures,
     all checks for that relation are SKIPPED. Returns a flat list of
     CheckResult.
+
+    The checks of one relation are executed together as a single statement;
+    each CheckResult still carries its own standalone query for the report.
+    A query shared by several relations (e.g. a 1:N and an N:1 declaring the
+    same pair) runs once and its count is reused. Relations only read, so
+    several run concurrently, each on its own cursor. Results keep the order
+    of relations.
     """
     logger.info("Starting relation checks")
     check_failed = check_failed_tables or set()
-    results: list[CheckResult] = []
 
+    planned: list[tuple[RelationDef, list[tuple[str, str]], str | None]] = []
+    # Queries to execute, each assigned to the first relation that uses it
+    batches: list[tuple[str, list[str]]] = []
+    seen: set[str] = set()
     for rel in relations:
-        from_errors = all_load_errors.get(rel.from_.table, [])
-        to_errors = all_load_errors.get(rel.to.table, [])
-        from_check_failed = rel.from_.table in check_failed
-        to_check_failed = rel.to.table in check_failed
         check_pairs = _build_relation_checks(rel)
+        skip_msg = _relation_skip_message(rel, all_load_errors, check_failed)
+        planned.append((rel, check_pairs, skip_msg))
+        if skip_msg is None:
+            queries = list(dict.fromkeys(q for _, q in check_pairs if q not in seen))
+            if queries:
+                seen.update(queries)
+                batches.append((rel.name, queries))
+
+    if len(batches) <= 1:
+        batch_outcomes = [
+            _count_relation_queries(conn, rel_name, queries)
+            for rel_name, queries in batches
+        ]
+    else:
+        max_workers = min(len(batches), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_count_on_cursor, conn.cursor(), rel_name, queries)
+                for rel_name, queries in batches
+            ]
+            batch_outcomes = [future.result() for future in futures]
+    outcomes: dict[str, int | Exception] = {}
+    for (_, queries), counts in zip(batches, batch_outcomes, strict=True):
+        outcomes.update(zip(queries, counts, strict=True))
 
-        if from_errors or to_errors or from_check_failed or to_check_failed:
-            skipped_tables = []
-            if from_errors:
-                skipped_tables.append(rel.from_.table)
-            if to_errors:
-                skipped_tables.append(rel.to.table)
-            if from_check_failed:
-                skipped_tables.append(f"{rel.from_.table} (check failed)")
-            if to_check_failed:
-                skipped_tables.append(f"{rel.to.table} (check failed)")
-            skip_msg = f"Skipped due to errors in: {', '.join(skipped_tables)}"
-            for desc, query in check_pairs:
+    results: list[CheckResult] = []
+    for rel, check_pairs, skip_msg in planned:
+        for desc, query in check_pairs:
+            if skip_msg is not None:
                 check_def = CheckDef(description=desc, query=query)
                 results.append(make_skipped_result(check_def, rel.name, skip_msg))
-            continue
-
-        for desc, query in check_pairs:
-            try:
-                row = conn.execute(query).fetchone()
-                count = int(row[0]) if row else 0
-                status = CheckStatus.OK if count == 0 else CheckStatus.NG
-                message = "" if status == CheckStatus.OK else f"Result count: {count}"
-                if status == CheckStatus.NG:
-                    logger.error(
-                        "Relation check failed",
-                        extra={
-                            "relation": rel.name,
-                            "check_description": desc,
-                        },
-                    )
-                results.append(
-                    CheckResult(
-                        description=desc,
-                        query=query,
-                        status=status,
-                        result_count=count,
-                        message=message,
-                    )
-                )
-            except Exception as e:
-                logger.error(
-                    "Relation check execution error",
-                    extra={
-                        "relation": rel.name,
-                        "check_description": desc,
-                        "error": str(e),
-                    },
-                )
-                results.append(
-                    CheckResult(
-                        description=desc,
-                        query=query,
-                        status=CheckStatus.ERROR,
-                        result_count=None,
-                        message=str(e),
-                    )
-                )
+            else:
+                results.append(_relation_result(rel.name, desc, query, outcomes[query]))
 
     logger.info("Relation checks completed")
     return results
@@ -374,8 +457,8 @@ def run_cross_checks(
                 status = CheckStatus.OK if value == 0 else CheckStatus.NG
             else:
                 status = CheckStatus.OK if value > 0 else CheckStatus.NG
-            message = "" if status == CheckStatus.OK else f"Result: {value}"
-            if status == CheckStatus.NG:
+            message = "" if status is CheckStatus.OK else f"Result: {value}"
+            if status is CheckStatus.NG:
                 logger.error(
                     "Cross-check failed",
                     extra={
@@ -6,10 +6,12 @@ results into a single HTML report.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 
 from .checker import CheckResult
 from .exporter import ExportResult
@@ -18,10 +20,16 @@ from .parser import TableDef
 from .profiler import ColumnProfile
 from .status import CheckStatus
 
+_FAILED_STATUSES = frozenset({CheckStatus.NG, CheckStatus.ERROR})
 
-@dataclass
+
+@dataclass(slots=True)
 class TableReport:
-    """Aggregated validation results for a single table."""
+    """Aggregated validation results for a single table.
+
+    ``has_check_failure`` and ``overall_status`` are computed once at
+    construction from the load errors and (aggregation) check results.
+    """
 
     table_def: TableDef
     load_errors: list[LoadError]
@@ -29,19 +37,48 @@ class TableReport:
     agg_check_results: list[CheckResult]
     profiles: list[ColumnProfile]
     export_result: ExportResult | None
+    has_check_failure: bool = field(init=False)
+    _overall_status: CheckStatus = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Precompute whether any check failed and the overall status."""
+        self.has_check_failure = any(
+            cr.status in _FAILED_STATUSES for cr in self.check_results
+        ) or any(cr.status in _FAILED_STATUSES for cr in self.agg_check_results)
+        self._overall_status = (
+            CheckStatus.NG
+            if self.load_errors or self.has_check_failure
+            else CheckStatus.OK
+        )
 
     @property
     def overall_status(self) -> CheckStatus:
         """Return NG if any load errors or check failures exist, otherwise OK."""
-        if self.load_errors:
-            return CheckStatus.NG
-        for cr in self.check_results:
-            if cr.status in (CheckStatus.NG, CheckStatus.ERROR):
-                return CheckStatus.NG
-        for cr in self.agg_check_results:
-            if cr.status in (CheckStatus.NG, CheckStatus.ERROR):
-                return CheckStatus.NG
-        return CheckStatus.OK
+        return self._overall_status
+
+
+def _status_summary(results: list[CheckResult]) -> dict[str, int]:
+    """Count results by status in a single pass; ERROR is counted as NG."""
+    counts = Counter(r.status for r in results)
+    return {
+        "total": len(results),
+        "ok": counts[CheckStatus.OK],
+        "ng": counts[CheckStatus.NG] + counts[CheckStatus.ERROR],
+        "skipped": counts[CheckStatus.SKIPPED],
+    }
+
+
+@lru_cache(maxsize=1)
+def _get_template() -> Template:
+    """Load and compile the report template once per process."""
+    template_dir = Path(__file__).parent / "templates"
+    env = Environment(
+        loader=FileSystemLoader(str(template_dir)),
+        autoescape=True,
+        auto_reload=False,
+        cache_size=-1,
+    )
+    return env.get_template("report.html.j2")
 
 
 def generate_report(
@@ -52,41 +89,23 @@ def generate_report(
     relation_check_results: list[CheckResult] | None = None,
     cross_check_results: list[CheckResult] | None = None,
 ) -> None:
-    """Render the HTML report from Jinja2 template and write to output_path."""
-    template_dir = Path(__file__).parent / "templates"
-    env = Environment(
-        loader=FileSystemLoader(str(template_dir)),
-        autoescape=True,
-    )
-    template = env.get_template("report.html.j2")
+    """Render the HTML report from Jinja2 template and stream it to output_path."""
+    template = _get_template()
 
+    table_counts = Counter(r.overall_status for r in table_reports)
     summary = {
         "total": len(table_reports),
-        "ok": sum(1 for r in table_reports if r.overall_status == CheckStatus.OK),
-        "ng": sum(1 for r in table_reports if r.overall_status == CheckStatus.NG),
+        "ok": table_counts[CheckStatus.OK],
+        "ng": table_counts[CheckStatus.NG],
     }
 
     rel_results = relation_check_results or []
-    relation_summary = {
-        "total": len(rel_results),
-        "ok": sum(1 for r in rel_results if r.status == CheckStatus.OK),
-        "ng": sum(
-            1 for r in rel_results if r.status in (CheckStatus.NG, CheckStatus.ERROR)
-        ),
-        "skipped": sum(1 for r in rel_results if r.status == CheckStatus.SKIPPED),
-    }
+    relation_summary = _status_summary(rel_results)
 
     cc_results = cross_check_results or []
-    cross_check_summary = {
-        "total": len(cc_results),
-        "ok": sum(1 for r in cc_results if r.status == CheckStatus.OK),
-        "ng": sum(
-            1 for r in cc_results if r.status in (CheckStatus.NG, CheckStatus.ERROR)
-        ),
-        "skipped": sum(1 for r in cc_results if r.status == CheckStatus.SKIPPED),
-    }
+    cross_check_summary = _status_summary(cc_results)
 
-    html = template.render(
+    stream = template.stream(
         executed_at=executed_at,
         db_path=db_path,
         table_reports=table_reports,
@@ -96,6 +115,8 @@ def generate_report(
         cross_check_results=cc_results,
         cross_check_summary=cross_check_summary,
     )
+    # Write in buffered chunks instead of building the whole document in memory
+    stream.enable_buffering(size=64)
 
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    Path(output_path).write_text(html, encoding="utf-8")
+    stream.dump(output_path, encoding="utf-8")
@@ -8,7 +8,9 @@ import pytest
 
 from tval.builder import (
     build_create_table_sql,
+    build_load_levels,
     build_load_order,
+    precompile_identifiers,
     quote_identifier,
     validate_identifier,
 )
@@ -94,6 +96,36 @@ class TestBuildLoadOrder:
         with pytest.raises(ValueError, match="Circular dependency"):
             build_load_order([a, b])
 
+    def test_fk_free_tables_keep_input_order(self, tmp_path: Path) -> None:
+        """Without foreign keys, tables should come back in input order."""
+        tdefs = [_make_tdef(tmp_path, name) for name in ("c", "a", "b")]
+        result = build_load_order(tdefs)
+        assert [t.table.name for t in result] == ["c", "a", "b"]
+
+    def test_load_levels_group_independent_tables(self, tmp_path: Path) -> None:
+        """Tables should be grouped into levels after the tables they reference."""
+        users = _make_tdef(tmp_path, "users")
+        items = _make_tdef(tmp_path, "items")
+        orders = _make_tdef(
+            tmp_path,
+            "orders",
+            fk_refs=[
+                {
+                    "columns": ["orders_id"],
+                    "references": {"table": "users", "columns": ["users_id"]},
+                },
+                {
+                    "columns": ["orders_id"],
+                    "references": {"table": "items", "columns": ["items_id"]},
+                },
+            ],
+        )
+        levels = build_load_levels([orders, users, items])
+        assert [[t.table.name for t in level] for level in levels] == [
+            ["users", "items"],
+            ["orders"],
+        ]
+
     def test_undefined_fk_reference_raises(self, tmp_path: Path) -> None:
         """FK referencing an undefined table should raise ValueError."""
         orders = _make_tdef(
@@ -134,6 +166,15 @@ class TestValidateIdentifier:
         with pytest.raises(ValueError, match="Invalid identifier"):
             validate_identifier("col name")
 
+    def test_validate_identifier_invalid_non_ascii_or_empty(self) -> None:
+        """Non-ASCII letters and empty names should raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid identifier"):
+            validate_identifier("名前")
+        with pytest.raises(ValueError, match="Invalid identifier"):
+            validate_identifier("caf\u00e9")
+        with pytest.raises(ValueError, match="Invalid identifier"):
+            validate_identifier("")
+
 
 class TestQuoteIdentifier:
     """Tests for quote_identifier."""
@@ -143,6 +184,28 @@ class TestQuoteIdentifier:
         assert quote_identifier("users") == '"users"'
         assert quote_identifier("_t1") == '"_t1"'
 
+    def test_precompile_identifiers_populates_cache(self, tmp_path: Path) -> None:
+        """Table, column and FK reference names should be quoted up front."""
+        parent = _make_tdef(tmp_path, "pc_parent")
+        child = _make_tdef(
+            tmp_path,
+            "pc_child",
+            fk_refs=[
+                {
+                    "columns": ["pc_child_id"],
+                    "references": {
+                        "table": "pc_parent",
+                        "columns": ["pc_parent_id"],
+                    },
+                }
+            ],
+        )
+        precompile_identifiers([parent, child])
+        hits = quote_identifier.cache_info().hits
+        for name in ("pc_parent", "pc_parent_id", "pc_child", "pc_child_id"):
+            assert quote_identifier(name) == f'"{name}"'
+        assert quote_identifier.cache_info().hits == hits + 4
+
 
 class TestBuildCreateTableSql:
     """Tests for build_create_table_sql."""
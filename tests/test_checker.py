@@ -188,6 +188,42 @@ class TestChecker:
         results, _ = run_checks(conn, tdef, load_errors)
         assert all(r.status == CheckStatus.SKIPPED for r in results)
 
+    def test_generated_checks_skipped_match_executed(self, tmp_path: object) -> None:
+        """Skipped generated checks keep the descriptions and queries of a run."""
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "t" (id INTEGER, status VARCHAR)')
+        columns = [
+            ColumnDef(
+                name="id", logical_name="ID", type="INTEGER", not_null=True, min=0
+            ),
+            ColumnDef(
+                name="status",
+                logical_name="Status",
+                type="VARCHAR",
+                not_null=False,
+                allowed_values=["a", "b"],
+            ),
+        ]
+        row_conditions = [
+            RowConditionDef(condition="id < 100", description="id below 100")
+        ]
+        tdef = _make_tdef(tmp_path, columns=columns, row_conditions=row_conditions)
+        load_errors = [
+            LoadError(
+                file_path="test.csv",
+                error_type="UNKNOWN",
+                column=None,
+                row=None,
+                raw_message="error",
+            )
+        ]
+        executed, _ = run_checks(conn, tdef, [])
+        skipped, _ = run_checks(conn, tdef, load_errors)
+        assert [(r.description, r.query) for r in skipped] == [
+            (r.description, r.query) for r in executed
+        ]
+        assert all(r.status == CheckStatus.SKIPPED for r in skipped)
+
     def test_aggregation_checks_skipped_on_load_errors(self, tmp_path: object) -> None:
         """Aggregation checks should be SKIPPED when load errors exist."""
         conn = duckdb.connect()
@@ -396,3 +432,54 @@ class TestChecker:
         rc_results = [r for r in results if r.description == "always true"]
         assert len(rc_results) == 1
         assert rc_results[0].status == CheckStatus.SKIPPED
+
+    def test_generated_checks_fused_with_mixed_results(self, tmp_path: object) -> None:
+        """Fused allowed-value, range and row checks should keep per-check status."""
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "t" (status VARCHAR, val INTEGER)')
+        conn.execute("INSERT INTO \"t\" VALUES ('a', 5), ('x', 50)")
+        col_status = ColumnDef(
+            name="status",
+            logical_name="Status",
+            type="VARCHAR",
+            not_null=False,
+            allowed_values=["a", "b"],
+        )
+        col_val = ColumnDef(
+            name="val",
+            logical_name="Value",
+            type="INTEGER",
+            not_null=False,
+            min=0,
+            max=100,
+        )
+        rc = RowConditionDef(description="val below 10", condition="val < 10")
+        tdef = _make_tdef(tmp_path, columns=[col_status, col_val], row_conditions=[rc])
+        results, _ = run_checks(conn, tdef, [])
+        assert [r.status for r in results] == [
+            CheckStatus.NG,
+            CheckStatus.OK,
+            CheckStatus.NG,
+        ]
+        assert [r.result_count for r in results] == [1, 0, 1]
+        assert all('FROM "t"' in r.query for r in results)
+
+    def test_invalid_row_condition_does_not_poison_batch(
+        self, tmp_path: object
+    ) -> None:
+        """A malformed row condition should only error its own check."""
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "t" (id INTEGER, val INTEGER)')
+        conn.execute('INSERT INTO "t" VALUES (1, 10)')
+        col_val = ColumnDef(
+            name="val",
+            logical_name="Value",
+            type="INTEGER",
+            not_null=True,
+        )
+        good = RowConditionDef(description="good", condition="val > 0")
+        bad = RowConditionDef(description="bad", condition="no_such_col > 0")
+        tdef = _make_tdef(tmp_path, columns=[col_val], row_conditions=[good, bad])
+        results, _ = run_checks(conn, tdef, [])
+        statuses = {r.description: r.status for r in results}
+        assert statuses == {"good": CheckStatus.OK, "bad": CheckStatus.ERROR}
@@ -5,8 +5,14 @@ from __future__ import annotations
 from pathlib import Path
 
 import duckdb
+import pytest
 
-from tval.exporter import _escape_string_literal, export_table
+from tval.exporter import (
+    _escape_string_literal,
+    _resolve_base_dir,
+    export_table,
+    export_tables,
+)
 from tval.parser import TableDef
 from tval.status import ExportStatus
 
@@ -14,15 +20,16 @@ from tval.status import ExportStatus
 def _make_tdef(
     tmp_path: Path,
     *,
+    name: str = "t",
     partition_by: list[str] | None = None,
 ) -> TableDef:
     """Create a minimal TableDef for exporter tests."""
-    d = tmp_path / "data" / "t"
+    d = tmp_path / "data" / name
     d.mkdir(parents=True, exist_ok=True)
     return TableDef.model_validate(
         {
             "table": {
-                "name": "t",
+                "name": name,
                 "description": "test table",
                 "source_dir": str(d),
             },
@@ -100,6 +107,51 @@ class TestExporter:
         assert result.status == ExportStatus.ERROR
         assert result.message != ""
 
+    def test_export_tables_multiple(self, tmp_path: Path) -> None:
+        """Concurrent export should write every table and report OK for each."""
+        conn = duckdb.connect()
+        for name in ("t", "u"):
+            conn.execute(f'CREATE TABLE "{name}" (id INTEGER, cat VARCHAR)')
+            conn.execute(f"INSERT INTO \"{name}\" VALUES (1, 'a'), (2, 'b')")
+        tdefs = [
+            _make_tdef(tmp_path, name="t"),
+            _make_tdef(tmp_path, name="u", partition_by=["cat"]),
+        ]
+        results = export_tables(conn, tdefs, tmp_path / "out")
+        assert [r.table_name for r in results] == ["t", "u"]
+        assert all(r.status == ExportStatus.OK for r in results)
+        assert all(Path(r.output_path).exists() for r in results)
+
+    def test_export_tables_failure_is_per_table(self, tmp_path: Path) -> None:
+        """A failing table should not fail the other tables."""
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "t" (id INTEGER, cat VARCHAR)')
+        conn.execute("INSERT INTO \"t\" VALUES (1, 'a')")
+        # Table "u" does not exist — only its export should fail
+        tdefs = [_make_tdef(tmp_path, name="u"), _make_tdef(tmp_path, name="t")]
+        results = export_tables(conn, tdefs, tmp_path / "out")
+        assert [r.status for r in results] == [ExportStatus.ERROR, ExportStatus.OK]
+        assert results[0].message != ""
+
+    def test_export_tables_resolves_base_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The base directory should be resolved once, not per table."""
+        conn = duckdb.connect()
+        for name in ("t", "u"):
+            conn.execute(f'CREATE TABLE "{name}" (id INTEGER, cat VARCHAR)')
+        calls: list[Path] = []
+
+        def counting_resolve(output_base_dir: str | Path) -> Path:
+            calls.append(Path(output_base_dir))
+            return _resolve_base_dir(output_base_dir)
+
+        monkeypatch.setattr("tval.exporter._resolve_base_dir", counting_resolve)
+        tdefs = [_make_tdef(tmp_path, name="t"), _make_tdef(tmp_path, name="u")]
+        results = export_tables(conn, tdefs, tmp_path / "out")
+        assert all(r.status == ExportStatus.OK for r in results)
+        assert calls == [tmp_path / "out"]
+
     def test_escape_string_literal(self) -> None:
         """Single quotes should be doubled."""
         assert _escape_string_literal("it's") == "it''s"
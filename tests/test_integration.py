@@ -367,6 +367,45 @@ class TestIntegration:
         content = report.read_text(encoding="utf-8")
         assert "EXTRA_COLUMNS" in content
 
+    def test_run_incremental_reuses_unchanged_database(self, tmp_path: Path) -> None:
+        """Incremental mode should skip reloading until a source file changes."""
+        config_path = _setup_project(tmp_path)
+        config = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+        config["incremental"] = True
+        config_path.write_text(yaml.dump(config), encoding="utf-8")
+
+        run(str(config_path))
+        with patch("tval.main._load_data") as load_data:
+            run(str(config_path))
+        load_data.assert_not_called()
+
+        orders_csv = tmp_path / "tval" / "data" / "orders" / "orders.csv"
+        orders_csv.write_text(
+            orders_csv.read_text(encoding="utf-8") + "99,1,1.0,pending\n",
+            encoding="utf-8",
+        )
+        run(str(config_path))
+        db_path = tmp_path / "tval" / "work.duckdb"
+        with duckdb.connect(str(db_path), read_only=True) as conn:
+            row = conn.execute(
+                'SELECT COUNT(*) FROM "orders" WHERE "order_id" = 99'
+            ).fetchone()
+        assert row == (1,)
+
+    def test_run_applies_duckdb_settings(self, tmp_path: Path) -> None:
+        """The duckdb section should be passed to every connection run opens."""
+        config_path = _setup_project(tmp_path)
+        config = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+        config["duckdb"] = {"threads": 1, "memory_limit": "512MB"}
+        config_path.write_text(yaml.dump(config), encoding="utf-8")
+
+        with patch("tval.main.duckdb.connect", wraps=duckdb.connect) as connect:
+            run(str(config_path))
+        assert connect.call_count == 2
+        for call in connect.call_args_list:
+            assert call.kwargs["config"] == {"threads": 1, "memory_limit": "512MB"}
+        assert (tmp_path / "tval" / "output" / "report.html").exists()
+
 
 class TestP0ErrorResilience:
     """P0: Error resilience tests."""
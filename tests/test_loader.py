@@ -9,9 +9,11 @@ import pytest
 
 from tval.loader import (
     EncodingDetectionError,
+    _build_insert_clauses,
     _check_extra_columns,
     _col_expr,
-    _resolve_csv_path,
+    _detect_csv_encoding,
+    _transcode_to_utf8,
     load_files,
     parse_duckdb_error,
 )
@@ -89,7 +91,7 @@ class TestResolveCsvPath:
         with pytest.raises(
             EncodingDetectionError, match="confidence is below threshold"
         ):
-            _resolve_csv_path(str(csv_file), confidence_threshold=0.99)
+            _detect_csv_encoding(str(csv_file), confidence_threshold=0.99)
 
 
 def _make_tdef(tmp_path: Path, source_dir: str | None = None) -> TableDef:
@@ -205,31 +207,181 @@ class TestLoadFiles:
         assert name is not None
         assert name[0] == "テスト名前1"
 
+    def test_load_utf16_csv_file(self, tmp_path: Path) -> None:
+        """UTF-16 CSV files should be loaded without a temporary copy."""
+        data_dir = tmp_path / "data" / "t"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        csv_file = data_dir / "test.csv"
+        csv_file.write_bytes("id,name\n1,テスト\n2,café\n".encode("utf-16"))
+
+        tdef = _make_tdef(tmp_path, source_dir=str(data_dir))
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "t" (id INTEGER NOT NULL, name VARCHAR)')
+        errors = load_files(conn, tdef)
+        assert errors == []
+        rows = conn.execute('SELECT "id", "name" FROM "t" ORDER BY "id"').fetchall()
+        assert rows == [(1, "テスト"), (2, "café")]
+
+    def test_load_utf8_bom_csv_file(self, tmp_path: Path) -> None:
+        """The BOM of a UTF-8 CSV should not leak into the first column name."""
+        data_dir = tmp_path / "data" / "t"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        csv_file = data_dir / "test.csv"
+        csv_file.write_bytes(b"\xef\xbb\xbf" + "id,name\n1,テスト\n".encode("utf-8"))
+
+        tdef = _make_tdef(tmp_path, source_dir=str(data_dir))
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "t" (id INTEGER NOT NULL, name VARCHAR)')
+        errors = load_files(conn, tdef)
+        assert errors == []
+        rows = conn.execute('SELECT "id", "name" FROM "t"').fetchall()
+        assert rows == [(1, "テスト")]
+
+    def test_load_multiple_csv_files_in_one_batch(self, tmp_path: Path) -> None:
+        """All CSV files of a table should be loaded."""
+        data_dir = tmp_path / "data" / "t"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        (data_dir / "a.csv").write_text("id,name\n1,Alice\n", encoding="utf-8")
+        (data_dir / "b.csv").write_text("id,name\n2,Bob\n3,Carol\n", encoding="utf-8")
+
+        tdef = _make_tdef(tmp_path, source_dir=str(data_dir))
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "t" (id INTEGER NOT NULL, name VARCHAR)')
+        errors = load_files(conn, tdef)
+        assert errors == []
+        row = conn.execute('SELECT COUNT(*) FROM "t"').fetchone()
+        assert row is not None
+        assert row[0] == 3
+
+    def test_failing_csv_in_batch_is_reported_per_file(self, tmp_path: Path) -> None:
+        """A bad CSV should only fail itself; other files are still loaded."""
+        data_dir = tmp_path / "data" / "t"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        (data_dir / "a.csv").write_text("id,name\n1,Alice\n", encoding="utf-8")
+        (data_dir / "b.csv").write_text("id,name\nabc,Bob\n", encoding="utf-8")
+        (data_dir / "c.csv").write_text("id,name\n3,Carol\n", encoding="utf-8")
+
+        tdef = _make_tdef(tmp_path, source_dir=str(data_dir))
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "t" (id INTEGER NOT NULL, name VARCHAR)')
+        errors = load_files(conn, tdef)
+        assert [Path(e.file_path).name for e in errors] == ["b.csv"]
+        ids = conn.execute('SELECT "id" FROM "t" ORDER BY "id"').fetchall()
+        assert ids == [(1,), (3,)]
+
+    def test_files_inserted_in_name_order_across_encodings(
+        self, tmp_path: Path
+    ) -> None:
+        """A duplicate key should be blamed on the later file, as in file order."""
+        data_dir = tmp_path / "data" / "t"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        (data_dir / "a.csv").write_text("id,name\n1,Alice\n", encoding="utf-8")
+        (data_dir / "b.csv").write_bytes("id,name\n2,Bob\n".encode("utf-16"))
+        (data_dir / "c.csv").write_text("id,name\n2,Carol\n", encoding="utf-8")
+
+        tdef = _make_tdef(tmp_path, source_dir=str(data_dir))
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "t" (id INTEGER PRIMARY KEY, name VARCHAR)')
+        errors = load_files(conn, tdef)
+        assert [Path(e.file_path).name for e in errors] == ["c.csv"]
+        rows = conn.execute('SELECT * FROM "t" ORDER BY "id"').fetchall()
+        assert rows == [(1, "Alice"), (2, "Bob")]
+
+    def test_transcoded_copies_removed_after_load(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Temporary UTF-8 copies of non-UTF-8 CSVs should not outlive the load."""
+        data_dir = tmp_path / "data" / "t"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        names = "山田太郎 鈴木花子 佐藤次郎 田中一郎 高橋美咲 伊藤健太".split()
+        for part in (0, 1):
+            rows = "".join(f"{i},{names[i]}\n" for i in range(part * 3, part * 3 + 3))
+            content = "id,name\n" + rows
+            (data_dir / f"{part}.csv").write_bytes(content.encode("cp932"))
+        tmp_dir = tmp_path / "tmp"
+        tmp_dir.mkdir()
+        monkeypatch.setattr("tempfile.tempdir", str(tmp_dir))
+
+        tdef = _make_tdef(tmp_path, source_dir=str(data_dir))
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "t" (id INTEGER NOT NULL, name VARCHAR)')
+        errors = load_files(conn, tdef, confidence_threshold=0.0)
+        assert errors == []
+        loaded = conn.execute('SELECT "name" FROM "t" ORDER BY "id"').fetchall()
+        assert [r[0] for r in loaded] == names
+        assert list(tmp_dir.iterdir()) == []
+
+    def test_parquet_files_batched_with_per_file_fallback(self, tmp_path: Path) -> None:
+        """Parquet files load together; a file missing a column fails alone."""
+        data_dir = tmp_path / "data" / "t"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        conn = duckdb.connect()
+        conn.execute(
+            f"COPY (SELECT 1 AS id, 'Alice' AS name) TO '{data_dir / 'a.parquet'}'"
+        )
+        conn.execute(
+            f"COPY (SELECT 2 AS id, 'Bob' AS name) TO '{data_dir / 'b.parquet'}'"
+        )
+        conn.execute(f"COPY (SELECT 3 AS id) TO '{data_dir / 'c.parquet'}'")
+
+        tdef = _make_tdef(tmp_path, source_dir=str(data_dir))
+        conn.execute('CREATE TABLE "t" (id INTEGER NOT NULL, name VARCHAR)')
+        errors = load_files(conn, tdef)
+        assert [Path(e.file_path).name for e in errors] == ["c.parquet"]
+        rows = conn.execute('SELECT * FROM "t" ORDER BY "id"').fetchall()
+        assert rows == [(1, "Alice"), (2, "Bob")]
+
 
 class TestResolveCsvPathUtf8:
-    """Tests for _resolve_csv_path with UTF-8 content."""
+    """Tests for _detect_csv_encoding and _transcode_to_utf8."""
 
     def test_resolve_csv_path_utf8_returns_original(self, tmp_path: Path) -> None:
-        """UTF-8 CSV should be returned as-is without a temp file."""
+        """UTF-8 CSV should be read as-is without a temp file."""
         csv_file = tmp_path / "test.csv"
         csv_file.write_text("id,name\n1,Alice\n", encoding="utf-8")
-        resolved, is_tmp = _resolve_csv_path(str(csv_file), confidence_threshold=0.5)
-        assert resolved == str(csv_file)
-        assert is_tmp is False
+        encoding, transcode_from = _detect_csv_encoding(
+            str(csv_file), confidence_threshold=0.5
+        )
+        assert encoding is None
+        assert transcode_from is None
 
     def test_resolve_csv_path_sjis_creates_tmp(self, tmp_path: Path) -> None:
         """SJIS CSV should be converted to a temporary UTF-8 file."""
         csv_file = tmp_path / "test.csv"
         content = "id,名前\n1,太郎\n2,花子\n"
         csv_file.write_bytes(content.encode("cp932"))
-        resolved, is_tmp = _resolve_csv_path(str(csv_file), confidence_threshold=0.5)
+        encoding, transcode_from = _detect_csv_encoding(
+            str(csv_file), confidence_threshold=0.5
+        )
+        assert encoding is None
+        assert transcode_from is not None
+        resolved = _transcode_to_utf8(str(csv_file), transcode_from)
         assert resolved != str(csv_file)
-        assert is_tmp is True
         resolved_content = Path(resolved).read_text(encoding="utf-8")
         assert "名前" in resolved_content
         assert "太郎" in resolved_content
         Path(resolved).unlink(missing_ok=True)
 
+    def test_resolve_csv_path_utf8_bom_returns_original(self, tmp_path: Path) -> None:
+        """UTF-8 CSV with a BOM should be read as-is without a temp file."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_bytes(b"\xef\xbb\xbf" + "id,名前\n1,太郎\n".encode("utf-8"))
+        encoding, transcode_from = _detect_csv_encoding(
+            str(csv_file), confidence_threshold=0.99
+        )
+        assert encoding is None
+        assert transcode_from is None
+
+    def test_resolve_csv_path_utf16_read_natively(self, tmp_path: Path) -> None:
+        """UTF-16 CSV should be passed to DuckDB as-is with its encoding."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_bytes("id,名前\n1,太郎\n".encode("utf-16"))
+        encoding, transcode_from = _detect_csv_encoding(
+            str(csv_file), confidence_threshold=0.5
+        )
+        assert encoding == "utf-16"
+        assert transcode_from is None
+
 
 class TestColExpr:
     """Tests for _col_expr column expression building."""
@@ -259,6 +411,35 @@ class TestColExpr:
         assert "created_at" in expr
 
 
+class TestBuildInsertClauses:
+    """Tests for _build_insert_clauses."""
+
+    def test_without_format_selects_all(self, tmp_path: Path) -> None:
+        """Tables without format columns should use SELECT * and schema types."""
+        tdef = _make_tdef(tmp_path)
+        select_clause, columns_override = _build_insert_clauses(tdef)
+        assert select_clause == "SELECT *"
+        assert columns_override == "{'id': 'INTEGER', 'name': 'VARCHAR'}"
+
+    def test_with_format_lists_columns(self, tmp_path: Path) -> None:
+        """Format columns should be read as VARCHAR and parsed with STRPTIME."""
+        tdef = _make_tdef(tmp_path)
+        tdef.columns.append(
+            ColumnDef(
+                name="created_at",
+                logical_name="Created",
+                type="DATE",
+                not_null=False,
+                format="%Y-%m-%d",
+            )
+        )
+        select_clause, columns_override = _build_insert_clauses(tdef)
+        assert select_clause.startswith('SELECT "id", "name", STRPTIME(')
+        assert columns_override == (
+            "{'id': 'INTEGER', 'name': 'VARCHAR', 'created_at': 'VARCHAR'}"
+        )
+
+
 class TestCheckExtraColumns:
     """Tests for _check_extra_columns detection."""
 
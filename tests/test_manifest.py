@@ -0,0 +1,98 @@
+"""Tests for tval.manifest module."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import duckdb
+
+from tval.manifest import compute_fingerprints, read_manifest, write_manifest
+from tval.parser import TableDef
+
+
+def _make_tdef(source_dir: Path) -> TableDef:
+    """Create a minimal TableDef reading from source_dir."""
+    return TableDef.model_validate(
+        {
+            "table": {
+                "name": "t",
+                "description": "test",
+                "source_dir": str(source_dir),
+            },
+            "columns": [
+                {
+                    "name": "id",
+                    "logical_name": "ID",
+                    "type": "INTEGER",
+                    "not_null": True,
+                },
+            ],
+            "table_constraints": {
+                "primary_key": [],
+                "foreign_keys": [],
+                "unique": [],
+                "checks": [],
+                "aggregation_checks": [],
+            },
+        }
+    )
+
+
+class TestManifest:
+    """Tests for fingerprinting and the in-database manifest."""
+
+    def test_fingerprint_changes_with_source_files(self, tmp_path: Path) -> None:
+        """Editing, adding or hiding files should be reflected in the fingerprint."""
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        csv = data_dir / "a.csv"
+        csv.write_text("id\n1\n", encoding="utf-8")
+        tdef = _make_tdef(data_dir)
+
+        base = compute_fingerprints([tdef], 0.8)
+        assert compute_fingerprints([tdef], 0.8) == base
+
+        (data_dir / ".hidden").write_text("x", encoding="utf-8")
+        assert compute_fingerprints([tdef], 0.8) == base
+
+        csv.write_text("id\n1\n2\n", encoding="utf-8")
+        assert compute_fingerprints([tdef], 0.8) != base
+
+    def test_fingerprint_changes_with_schema_and_threshold(
+        self, tmp_path: Path
+    ) -> None:
+        """The schema hash should cover the definition and load settings."""
+        tdef = _make_tdef(tmp_path)
+        base = compute_fingerprints([tdef], 0.8)
+        assert compute_fingerprints([tdef], 0.9) != base
+
+        changed = tdef.model_copy(deep=True)
+        changed.columns[0].not_null = False
+        assert compute_fingerprints([changed], 0.8) != base
+
+    def test_manifest_round_trip(self, tmp_path: Path) -> None:
+        """write_manifest output should be read back unchanged."""
+        db_path = tmp_path / "work.duckdb"
+        fingerprints = {"a": ("s1", "f1"), "b": ("s2", "f2")}
+        with duckdb.connect(str(db_path)) as conn:
+            write_manifest(conn, fingerprints)
+        with duckdb.connect(str(db_path), read_only=True) as conn:
+            assert read_manifest(conn) == fingerprints
+
+    def test_read_manifest_missing(self) -> None:
+        """A database without a manifest table should read as None."""
+        with duckdb.connect() as conn:
+            assert read_manifest(conn) is None
+
+    def test_manifest_kept_out_of_user_tables(self) -> None:
+        """The manifest should live in its own schema, apart from user tables."""
+        with duckdb.connect() as conn:
+            conn.execute('CREATE TABLE "manifest" (id INTEGER)')
+            conn.execute('CREATE TABLE "_tval_manifest" (id INTEGER)')
+            write_manifest(conn, {"a": ("s1", "f1")})
+            assert read_manifest(conn) == {"a": ("s1", "f1")}
+            main_tables = conn.execute(
+                "SELECT table_name FROM duckdb_tables() "
+                "WHERE schema_name = 'main' ORDER BY table_name"
+            ).fetchall()
+            assert main_tables == [("_tval_manifest",), ("manifest",)]
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import os
+from datetime import date
 from pathlib import Path
 
 import pytest
 import yaml
 from pydantic import ValidationError
 
-from tval.parser import load_table_definition
+from tval.parser import (
+    ProjectConfig,
+    load_table_definition,
+    load_table_definitions,
+    load_yaml,
+)
 
 
 @pytest.fixture()
@@ -159,6 +166,150 @@ class TestParserValid:
         tdef = load_table_definition(path, project_root=project_root)
         assert tdef.table_constraints.row_conditions == []
 
+    def test_load_yaml_decodes_utf8_with_bom(self, tmp_path: Path) -> None:
+        """load_yaml should decode UTF-8 bytes, including a leading BOM."""
+        p = tmp_path / "bom.yaml"
+        p.write_bytes("\ufeffname: 顧客\n".encode())
+        assert load_yaml(p) == {"name": "顧客"}
+
+    def test_load_yaml_uses_safe_c_loader(self, tmp_path: Path) -> None:
+        """load_yaml should prefer libyaml's CSafeLoader and stay a safe loader."""
+        from tval import parser
+
+        assert parser._YamlLoader is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        p = tmp_path / "unsafe.yaml"
+        p.write_text("x: !!python/object/apply:os.getcwd []\n", encoding="utf-8")
+        with pytest.raises(yaml.YAMLError):
+            load_yaml(p)
+
+    def test_load_table_definitions_keeps_file_order(
+        self, tmp_path: Path, data_dir: Path, project_root: Path
+    ) -> None:
+        """Parallel loading should return tables in sorted file name order."""
+        schema_dir = tmp_path / "schema"
+        schema_dir.mkdir()
+        names = ["c_orders", "a_users", "b_items", "d_logs"]
+        for name in names:
+            data = _valid_data(data_dir)
+            data["table"]["name"] = name  # type: ignore[index]
+            (schema_dir / f"{name}.yaml").write_text(
+                yaml.dump(data, allow_unicode=True), encoding="utf-8"
+            )
+        tdefs = load_table_definitions(schema_dir, project_root=project_root)
+        assert [t.table.name for t in tdefs] == sorted(names)
+
+    def test_shared_source_dir_resolved_once(
+        self,
+        tmp_path: Path,
+        data_dir: Path,
+        project_root: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Tables sharing a source_dir (and the root) should resolve once per load."""
+        schema_dir = tmp_path / "schema"
+        schema_dir.mkdir()
+        for name in ["a", "b", "c"]:
+            data = _valid_data(data_dir)
+            data["table"]["name"] = name  # type: ignore[index]
+            (schema_dir / f"{name}.yaml").write_text(
+                yaml.dump(data, allow_unicode=True), encoding="utf-8"
+            )
+        calls: list[str] = []
+        realpath = os.path.realpath
+        monkeypatch.setattr(
+            "tval.parser.os.path.realpath",
+            lambda p: calls.append(p) or realpath(p),
+        )
+        load_table_definitions(schema_dir, project_root=project_root)
+        assert calls.count(str(data_dir)) == 1
+        assert calls.count(project_root) == 1
+        # Nothing is cached across loads: the next load resolves again
+        load_table_definitions(schema_dir, project_root=project_root)
+        assert calls.count(project_root) == 2
+
+    def test_load_table_definitions_reports_all_invalid_files(
+        self, tmp_path: Path, data_dir: Path, project_root: Path
+    ) -> None:
+        """One ValidationError should cover every invalid schema file."""
+        schema_dir = tmp_path / "schema"
+        schema_dir.mkdir()
+        for i, name in enumerate(["a", "b", "c"]):
+            data = _valid_data(data_dir)
+            if i != 1:
+                data["columns"] = []
+            (schema_dir / f"{name}.yaml").write_text(
+                yaml.dump(data, allow_unicode=True), encoding="utf-8"
+            )
+        with pytest.raises(ValidationError) as exc_info:
+            load_table_definitions(schema_dir, project_root=project_root)
+        assert [e["loc"][0] for e in exc_info.value.errors()] == ["a.yaml", "c.yaml"]
+
+    def test_schema_cache_reused_until_file_changes(
+        self,
+        tmp_path: Path,
+        data_dir: Path,
+        project_root: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A matching schema cache should skip YAML parsing until a file changes."""
+        schema_dir = tmp_path / "schema"
+        schema_dir.mkdir()
+        schema_file = schema_dir / "users.yaml"
+        schema_file.write_text(
+            yaml.dump(_valid_data(data_dir), allow_unicode=True), encoding="utf-8"
+        )
+        cache = tmp_path / "cache" / "schema.json"
+
+        first = load_table_definitions(
+            schema_dir, project_root=project_root, cache_path=cache
+        )
+        assert cache.exists()
+
+        calls: list[object] = []
+        monkeypatch.setattr("tval.parser.load_yaml", lambda p: calls.append(p) or {})
+        second = load_table_definitions(
+            schema_dir, project_root=project_root, cache_path=cache
+        )
+        assert second == first
+        assert calls == []
+
+        monkeypatch.undo()
+        data = _valid_data(data_dir)
+        data["table"]["description"] = "Updated description"  # type: ignore[index]
+        schema_file.write_text(yaml.dump(data, allow_unicode=True), encoding="utf-8")
+        third = load_table_definitions(
+            schema_dir, project_root=project_root, cache_path=cache
+        )
+        assert third[0].table.description == "Updated description"
+
+    def test_schema_cache_keeps_date_params(
+        self, tmp_path: Path, data_dir: Path, project_root: Path
+    ) -> None:
+        """Check params parsed as YAML dates should keep their type via the cache."""
+        schema_dir = tmp_path / "schema"
+        schema_dir.mkdir()
+        data = _valid_data(data_dir)
+        data["table_constraints"]["checks"] = [  # type: ignore[index]
+            {
+                "description": "no future rows",
+                "query": "SELECT COUNT(*) FROM {table} WHERE created_at > ?",
+                "params": [date(2024, 1, 1)],
+            }
+        ]
+        (schema_dir / "users.yaml").write_text(
+            yaml.dump(data, allow_unicode=True), encoding="utf-8"
+        )
+        cache = tmp_path / "cache" / "schema.json"
+
+        first = load_table_definitions(
+            schema_dir, project_root=project_root, cache_path=cache
+        )
+        second = load_table_definitions(
+            schema_dir, project_root=project_root, cache_path=cache
+        )
+        assert first[0].table_constraints.checks[0].params == [date(2024, 1, 1)]
+        assert second == first
+
 
 class TestParserInvalid:
     """Tests for invalid schema definitions that should raise ValidationError."""
@@ -197,6 +348,20 @@ class TestParserInvalid:
         ):
             load_table_definition(path, project_root=project_root)
 
+    def test_source_dir_in_sibling_with_shared_prefix(
+        self, tmp_path: Path, data_dir: Path, project_root: Path
+    ) -> None:
+        """A sibling directory sharing the root's name prefix is outside it."""
+        sibling = tmp_path.parent / f"{tmp_path.name}_data"
+        sibling.mkdir(exist_ok=True)
+        data = _valid_data(data_dir)
+        data["table"]["source_dir"] = str(sibling)  # type: ignore[index]
+        path = _make_yaml(tmp_path, data)
+        with pytest.raises(
+            ValidationError, match="source_dir must be under the project root"
+        ):
+            load_table_definition(path, project_root=project_root)
+
     def test_pk_nonexistent_column(
         self, tmp_path: Path, data_dir: Path, project_root: Path
     ) -> None:
@@ -209,6 +374,20 @@ class TestParserInvalid:
         with pytest.raises(ValidationError, match="Column not found in primary_key"):
             load_table_definition(path, project_root=project_root)
 
+    def test_unique_lists_all_missing_columns(
+        self, tmp_path: Path, data_dir: Path, project_root: Path
+    ) -> None:
+        """All missing columns of a constraint are named in one error."""
+        data = _valid_data(data_dir)
+        data["table_constraints"]["unique"] = [  # type: ignore[index]
+            {"columns": ["missing_a", "name", "missing_b"]}
+        ]
+        path = _make_yaml(tmp_path, data)
+        with pytest.raises(
+            ValidationError, match="Column not found in unique: missing_a, missing_b"
+        ):
+            load_table_definition(path, project_root=project_root)
+
     def test_export_partition_by_nonexistent_column(
         self, tmp_path: Path, data_dir: Path, project_root: Path
     ) -> None:
@@ -239,6 +418,18 @@ class TestParserInvalid:
         ):
             load_table_definition(path, project_root=project_root)
 
+    def test_duckdb_threads_must_be_positive(self) -> None:
+        """duckdb.threads below 1 should raise ValidationError."""
+        with pytest.raises(ValidationError, match="threads must be >= 1"):
+            ProjectConfig.model_validate(
+                {
+                    "database_path": "work.duckdb",
+                    "schema_dir": "schema",
+                    "output_path": "report.html",
+                    "duckdb": {"threads": 0},
+                }
+            )
+
     def test_min_greater_than_max(
         self, tmp_path: Path, data_dir: Path, project_root: Path
     ) -> None:
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import duckdb
 
 from tval.loader import LoadError
-from tval.parser import DATETIME_TYPES, TableDef
+from tval.parser import DATETIME_TYPES, ProfileConfig, TableDef
 from tval.profiler import NUMERIC_TYPES, _is_numeric, _is_temporal, profile_table
 
 
@@ -66,6 +67,57 @@ class TestProfiler:
         assert p.mean is not None
         assert p.min is not None
         assert p.max is not None
+        assert (p.p25, p.median, p.p75) == (15.0, 20.0, 25.0)
+
+    def test_profile_all_null_numeric_column(self, tmp_path: object) -> None:
+        """An all-NULL numeric column should have no quartiles."""
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "t" (val INTEGER)')
+        conn.execute('INSERT INTO "t" VALUES (NULL), (NULL)')
+        tdef = _make_tdef(
+            tmp_path,
+            [
+                {
+                    "name": "val",
+                    "logical_name": "V",
+                    "type": "INTEGER",
+                    "not_null": False,
+                }
+            ],
+        )
+        p = profile_table(conn, tdef, [])[0]
+        assert p.error is None
+        assert p.not_null_count == 0
+        assert (p.p25, p.median, p.p75) == (None, None, None)
+
+    def test_profile_constant_columns_skip_spread_query(self, tmp_path: object) -> None:
+        """Constant and all-NULL columns should be completed from their bounds."""
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "t" ("c" INTEGER, "n" INTEGER, "s" VARCHAR)')
+        conn.execute("INSERT INTO \"t\" VALUES (5, NULL, 'a'), (5, NULL, 'a')")
+        tdef = _make_tdef(
+            tmp_path,
+            [
+                {"name": "c", "logical_name": "C", "type": "INTEGER", "not_null": True},
+                {
+                    "name": "n",
+                    "logical_name": "N",
+                    "type": "INTEGER",
+                    "not_null": False,
+                },
+                {"name": "s", "logical_name": "S", "type": "VARCHAR", "not_null": True},
+            ],
+        )
+        traced = MagicMock(wraps=conn)
+        const, nulls, text = profile_table(traced, tdef, [])
+        assert traced.execute.call_count == 1
+
+        assert const.unique_count == 1
+        assert (const.mean, const.std, const.min, const.max) == (5.0, 0.0, 5.0, 5.0)
+        assert (const.p25, const.median, const.p75) == (5.0, 5.0, 5.0)
+        assert (const.skewness, const.kurtosis) == (None, None)
+        assert (nulls.not_null_count, nulls.unique_count, nulls.mean) == (0, 0, None)
+        assert (text.not_null_count, text.unique_count) == (2, 1)
 
     def test_profile_non_numeric_column(self, tmp_path: object) -> None:
         """Non-numeric columns should have count/not_null/unique but no stats."""
@@ -173,6 +225,103 @@ class TestProfiler:
         assert profiles[0].error is not None
         assert profiles[0].count == 0
 
+    def test_profile_failure_is_attributed_per_column(self, tmp_path: object) -> None:
+        """One failing column should not lose the other columns' statistics."""
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "t" ("val" INTEGER, "name" VARCHAR)')
+        conn.execute("INSERT INTO \"t\" VALUES (1, 'a'), (3, 'b')")
+        tdef = _make_tdef(
+            tmp_path,
+            [
+                {
+                    "name": "val",
+                    "logical_name": "V",
+                    "type": "INTEGER",
+                    "not_null": True,
+                },
+                {
+                    "name": "missing_col",
+                    "logical_name": "Missing",
+                    "type": "VARCHAR",
+                    "not_null": False,
+                },
+                {
+                    "name": "name",
+                    "logical_name": "N",
+                    "type": "VARCHAR",
+                    "not_null": True,
+                },
+            ],
+        )
+        profiles = profile_table(conn, tdef, [])
+        assert [p.column_name for p in profiles] == ["val", "missing_col", "name"]
+        assert profiles[0].error is None
+        assert profiles[0].mean == 2.0
+        assert profiles[1].error is not None
+        assert profiles[2].error is None
+        assert profiles[2].unique_count == 2
+
+    def test_profile_approx_unique(self, tmp_path: object) -> None:
+        """approx_unique should use approx_count_distinct and flag the result."""
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "t" ("val" INTEGER)')
+        conn.execute('INSERT INTO "t" SELECT range % 50 FROM range(1000)')
+        tdef = _make_tdef(
+            tmp_path,
+            [{"name": "val", "logical_name": "V", "type": "INTEGER", "not_null": True}],
+        )
+        exact = profile_table(conn, tdef, [])[0]
+        assert exact.unique_count == 50
+        assert exact.unique_count_is_approx is False
+
+        approx = profile_table(conn, tdef, [], ProfileConfig(approx_unique=True))[0]
+        assert approx.unique_count_is_approx is True
+        assert abs(approx.unique_count - 50) <= 5
+
+    def test_profile_approx_quantiles(self, tmp_path: object) -> None:
+        """approx_quantiles should estimate quartiles and flag the result."""
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "t" ("val" INTEGER)')
+        conn.execute('INSERT INTO "t" SELECT range FROM range(1001)')
+        tdef = _make_tdef(
+            tmp_path,
+            [{"name": "val", "logical_name": "V", "type": "INTEGER", "not_null": True}],
+        )
+        exact = profile_table(conn, tdef, [])[0]
+        assert (exact.p25, exact.median, exact.p75) == (250.0, 500.0, 750.0)
+        assert exact.quantiles_are_approx is False
+
+        options = ProfileConfig(approx_quantiles=True)
+        approx = profile_table(conn, tdef, [], options)[0]
+        assert approx.quantiles_are_approx is True
+        assert approx.p25 is not None and abs(approx.p25 - 250) <= 10
+        assert approx.median is not None and abs(approx.median - 500) <= 10
+        assert approx.p75 is not None and abs(approx.p75 - 750) <= 10
+
+    def test_profile_without_moments(self, tmp_path: object) -> None:
+        """include_moments=False should leave skewness and kurtosis empty."""
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "t" ("val" INTEGER, "k" INTEGER)')
+        conn.execute('INSERT INTO "t" SELECT range, 7 FROM range(1, 101)')
+        tdef = _make_tdef(
+            tmp_path,
+            [
+                {
+                    "name": "val",
+                    "logical_name": "V",
+                    "type": "INTEGER",
+                    "not_null": True,
+                },
+                {"name": "k", "logical_name": "K", "type": "INTEGER", "not_null": True},
+            ],
+        )
+        options = ProfileConfig(include_moments=False)
+        varying, constant = profile_table(conn, tdef, [], options)
+        assert (varying.skewness, varying.kurtosis) == (None, None)
+        assert (varying.mean, varying.median) == (50.5, 50.5)
+        assert varying.std is not None
+        assert (constant.mean, constant.std, constant.p75) == (7.0, 0.0, 7.0)
+
     def test_profile_date_column(self, tmp_path: object) -> None:
         """DATE columns should have is_temporal=True with min/max as strings."""
         conn = duckdb.connect()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import duckdb
 import pytest
@@ -14,6 +15,7 @@ from tval.parser import TableDef
 from tval.relation import (
     CrossCheckDef,
     RelationDef,
+    _build_referential_sql,
     load_relations,
     run_cross_checks,
     run_relation_checks,
@@ -327,6 +329,87 @@ class TestRunRelationChecks:
         assert all(r.status == CheckStatus.SKIPPED for r in results)
         assert "check failed" in results[0].message
 
+    def test_referential_sql_uses_hash_anti_join(self) -> None:
+        """Orphan detection should plan as a hash anti join, not a LEFT JOIN."""
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "orders" (a INTEGER, b INTEGER)')
+        conn.execute('CREATE TABLE "users" (a INTEGER, b INTEGER)')
+        conn.execute('INSERT INTO "orders" VALUES (1, 1), (2, 1), (NULL, 1), (1, NULL)')
+        conn.execute('INSERT INTO "users" VALUES (1, 1), (1, 1)')
+        sql = _build_referential_sql(
+            '"orders"', ['"a"', '"b"'], '"users"', ['"a"', '"b"']
+        )
+        assert "ANTI JOIN" in sql
+        assert conn.execute(sql).fetchone() == (1,)
+        derived, _, outer = sql.partition(") s ANTI JOIN")
+        assert 'WHERE "a" IS NOT NULL AND "b" IS NOT NULL' in derived
+        assert "WHERE" not in outer
+        plan = conn.execute(f"EXPLAIN {sql}").fetchall()[0][1]
+        assert "HASH_JOIN" in plan
+        assert "ANTI" in plan
+
+    def test_relation_checks_run_as_one_statement(self) -> None:
+        """All checks of a relation should be counted by a single query."""
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "users" (user_id INTEGER)')
+        conn.execute('CREATE TABLE "profiles" (user_id INTEGER)')
+        conn.execute('INSERT INTO "users" VALUES (1), (2), (2), (3)')
+        conn.execute('INSERT INTO "profiles" VALUES (1), (4), (5)')
+        rel = _make_relation("1:1", "users", ["user_id"], "profiles", ["user_id"])
+        traced = MagicMock(wraps=conn)
+        results = run_relation_checks(traced, [rel], {})
+        assert traced.execute.call_count == 1
+        assert [r.result_count for r in results] == [1, 0, 3, 2]
+
+    def test_multiple_relations_keep_order(self) -> None:
+        """Concurrently run relations should return results in relation order."""
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "users" (user_id INTEGER)')
+        conn.execute('CREATE TABLE "orders" (user_id INTEGER)')
+        conn.execute('INSERT INTO "users" VALUES (1), (2)')
+        conn.execute('INSERT INTO "orders" VALUES (1), (3)')
+        rels = [
+            _make_relation("1:N", "users", ["user_id"], "orders", ["user_id"], "r1"),
+            _make_relation("N:N", "users", ["user_id"], "orders", ["user_id"], "r2"),
+            _make_relation("N:1", "orders", ["user_id"], "users", ["user_id"], "r3"),
+        ]
+        results = run_relation_checks(conn, rels, {})
+        prefixes = [r.description[:4] for r in results]
+        assert prefixes == ["[r1]", "[r1]", "[r2]", "[r2]", "[r3]", "[r3]"]
+        assert [r.result_count for r in results] == [0, 1, 1, 1, 0, 1]
+
+    def test_shared_queries_run_once(self) -> None:
+        """A 1:N and N:1 declaring the same pair should reuse the same counts."""
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "users" (user_id INTEGER)')
+        conn.execute('CREATE TABLE "orders" (user_id INTEGER)')
+        conn.execute('INSERT INTO "users" VALUES (1), (1), (2)')
+        conn.execute('INSERT INTO "orders" VALUES (1), (3)')
+        rels = [
+            _make_relation("1:N", "users", ["user_id"], "orders", ["user_id"], "r1"),
+            _make_relation("N:1", "orders", ["user_id"], "users", ["user_id"], "r2"),
+        ]
+        traced = MagicMock(wraps=conn)
+        results = run_relation_checks(traced, rels, {})
+        assert traced.execute.call_count == 1
+        assert [r.description[:4] for r in results] == ["[r1]", "[r1]", "[r2]", "[r2]"]
+        assert [r.result_count for r in results] == [1, 1, 1, 1]
+        assert all(r.status == CheckStatus.NG for r in results)
+
+    def test_missing_table_errors_attributed_per_check(self) -> None:
+        """A failing relation statement should fall back to per-check queries."""
+        conn = duckdb.connect()
+        conn.execute('CREATE TABLE "users" (user_id INTEGER)')
+        conn.execute('INSERT INTO "users" VALUES (1)')
+        rel = _make_relation("1:1", "users", ["user_id"], "profiles", ["user_id"])
+        results = run_relation_checks(conn, [rel], {})
+        assert [r.status for r in results] == [
+            CheckStatus.OK,
+            CheckStatus.ERROR,
+            CheckStatus.ERROR,
+            CheckStatus.ERROR,
+        ]
+
 
 class TestValidateCrossCheckRefs:
     """Tests for cross-check reference validation."""
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
 
+import pytest
+from jinja2 import Environment, FileSystemLoader
+
 from tval.checker import CheckResult
 from tval.loader import LoadError
 from tval.parser import TableDef
-from tval.reporter import TableReport, generate_report
+from tval.reporter import TableReport, _get_template, generate_report
 from tval.status import CheckStatus
 
 
@@ -111,6 +115,19 @@ class TestReporter:
         )
         assert report.overall_status == CheckStatus.NG
 
+    def test_has_check_failure_from_aggregation_checks(self, tmp_path: Path) -> None:
+        """A failing aggregation check should set has_check_failure."""
+        report = TableReport(
+            table_def=_make_tdef(tmp_path),
+            load_errors=[],
+            check_results=[_make_check_result(CheckStatus.OK)],
+            agg_check_results=[_make_check_result(CheckStatus.NG)],
+            profiles=[],
+            export_result=None,
+        )
+        assert report.has_check_failure is True
+        assert report.overall_status == CheckStatus.NG
+
     def test_generate_report_creates_file(self, tmp_path: Path) -> None:
         """generate_report should create an HTML file."""
         report = TableReport(
@@ -133,3 +150,37 @@ class TestReporter:
         content = result.read_text(encoding="utf-8")
         assert "tval Validation Report" in content
         assert "t" in content
+
+    def test_template_loaded_once_across_reports(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Rendering two reports should read the template source only once."""
+        calls: list[str] = []
+        get_source = FileSystemLoader.get_source
+
+        def counting_get_source(
+            self: FileSystemLoader, environment: Environment, template: str
+        ) -> tuple[str, str, Callable[[], bool]]:
+            calls.append(template)
+            return get_source(self, environment, template)
+
+        monkeypatch.setattr(FileSystemLoader, "get_source", counting_get_source)
+        _get_template.cache_clear()
+        report = TableReport(
+            table_def=_make_tdef(tmp_path),
+            load_errors=[],
+            check_results=[_make_check_result(CheckStatus.OK)],
+            agg_check_results=[],
+            profiles=[],
+            export_result=None,
+        )
+        for name in ("first.html", "second.html"):
+            generate_report(
+                table_reports=[report],
+                output_path=str(tmp_path / name),
+                db_path="test.duckdb",
+                executed_at="2024-01-01T00:00:00",
+            )
+        _get_template.cache_clear()
+        assert (tmp_path / "second.html").exists()
+        assert calls == ["report.html.j2"]